@@ -1,14 +1,14 @@
 """Expansion planning and impact analysis."""
 
-import math
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from ..models.entities import Ware
+from ..models.entities import DATACLASS_SLOTS, Ware
 from ..models.ware_database import get_ware
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class InputRequirement:
     """Analysis of a single input ware requirement for expansion."""
     ware: Ware
@@ -21,7 +21,7 @@ class InputRequirement:
     surplus_or_deficit: float  # positive = surplus, negative = deficit
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BottleneckSolution:
     """A specific way to resolve a bottleneck."""
     solution_type: str  # "expand_production", "assign_miners", "purchase_market"
@@ -29,20 +29,20 @@ class BottleneckSolution:
     modules_needed: Optional[int] = None
     miners_needed: Optional[int] = None
     is_feasible: bool = True
-    blocking_issues: List[str] = field(default_factory=list)
+    blocking_issues: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Bottleneck:
     """A production bottleneck that must be resolved."""
     ware: Ware
     deficit: float  # units/hr shortage
     severity: str  # "critical" (>50% short), "high" (20-50%), "medium" (<20%)
-    solutions: List[BottleneckSolution] = field(default_factory=list)
+    solutions: Tuple[BottleneckSolution, ...] = ()
     recommended_solution: Optional[BottleneckSolution] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExpansionPlan:
     """Complete analysis of expanding production of a ware."""
     target_ware: Ware
@@ -53,25 +53,119 @@ class ExpansionPlan:
     increase_amount: float  # units/hr increase
     increase_percent: float
 
-    input_requirements: List[InputRequirement] = field(default_factory=list)
-    bottlenecks: List[Bottleneck] = field(default_factory=list)
-    recommendations: List[str] = field(default_factory=list)
+    input_requirements: Tuple[InputRequirement, ...] = ()
+    bottlenecks: Tuple[Bottleneck, ...] = ()
+    recommendations: Tuple[str, ...] = ()
     is_feasible: bool = True  # Can this expansion proceed without resolving bottlenecks?
 
 
 # Raw materials that can be mined
-RAW_MATERIALS = {
+RAW_MATERIALS = frozenset({
     "ore", "silicon", "nividium", "rawscrap",
     "hydrogen", "helium", "methane", "ice"
-}
+})
 
 
+@lru_cache(maxsize=512)
 def is_raw_material(ware_id: str) -> bool:
     """Check if a ware is a mineable raw material."""
     normalized = ware_id.lower().replace("_", "")
     return normalized in RAW_MATERIALS
 
 
+# Sentinel for stats cache misses (None is a valid cached result)
+_MISS = object()
+
+
+def _lookup_stats(analyzer, ware_id: str, stats_cache: Dict[str, object]):
+    """
+    Look up ProductionStats for a ware, memoized per expansion analysis.
+
+    The same input wares are looked up for the input requirements and
+    again for the bottleneck severity.
+    """
+    stats = stats_cache.get(ware_id, _MISS)
+    if stats is _MISS:
+        stats = analyzer.get_ware_stats(ware_id)
+        stats_cache[ware_id] = stats
+    return stats
+
+
+def _resolve_expansion(ware_id: str, wares_extractor, analyzer):
+    """Get current stats and the default production method for a ware to expand."""
+    # Get current stats from analyzer
+    current_stats = analyzer.get_ware_stats(ware_id)
+    if not current_stats:
+        raise ValueError(f"No production data found for '{ware_id}' in your empire")
+
+    # Get game data for this ware
+    game_ware = wares_extractor.wares.get(ware_id.lower())
+    method = game_ware.default_method if game_ware else None
+    if not method:
+        raise ValueError(f"No game production data for '{ware_id}' - may not be a producible ware")
+
+    return current_stats, method
+
+
+def calculate_expansion_feasibility(
+    ware_id: str,
+    additional_modules: int,
+    wares_extractor,
+    analyzer
+) -> Tuple[bool, float]:
+    """
+    Check whether an expansion is feasible without building a full plan.
+
+    Uses the same input balance rules as calculate_expansion_impact, but
+    skips the bottleneck solutions and recommendations. Useful when scoring
+    many candidate expansions.
+
+    Returns:
+        (is_feasible, total input deficit in units/hr)
+    """
+    _, method = _resolve_expansion(ware_id, wares_extractor, analyzer)
+    net_available = analyzer.net_available
+    resource_per_hour = method.resource_per_hour
+
+    total_deficit = 0.0
+    for resource in method.resources:
+        # No stats means we don't produce or consume this currently
+        net = net_available(resource.ware_id) or 0.0
+        surplus_or_deficit = net - additional_modules * resource_per_hour(resource.ware_id)
+        if surplus_or_deficit < 0:
+            total_deficit -= surplus_or_deficit
+
+    return total_deficit == 0.0, total_deficit
+
+
+def calculate_batch_feasibility(
+    candidates: Dict[str, int],
+    wares_extractor,
+    analyzer
+) -> Dict[str, Tuple[bool, float]]:
+    """
+    Check feasibility for many candidate expansions at once.
+
+    Args:
+        candidates: ware_id -> number of modules to add
+        wares_extractor: WaresExtractor instance with game data
+        analyzer: ProductionAnalyzer with current empire state
+
+    Returns:
+        ware_id -> (is_feasible, total input deficit in units/hr). Wares that
+        can't be expanded (not in the empire or not producible) are omitted.
+    """
+    results = {}
+    for ware_id, additional_modules in candidates.items():
+        try:
+            results[ware_id] = calculate_expansion_feasibility(
+                ware_id, additional_modules, wares_extractor, analyzer
+            )
+        except ValueError:
+            continue
+    return results
+
+
 def calculate_expansion_impact(
     ware_id: str,
     additional_modules: int,
@@ -90,18 +184,9 @@ def calculate_expansion_impact(
     Returns:
         Complete expansion analysis
     """
-    # Get current stats from analyzer
-    current_stats = analyzer.get_ware_stats(ware_id)
-    if not current_stats:
-        raise ValueError(f"No production data found for '{ware_id}' in your empire")
-
-    # Get game data for this ware
-    game_ware = wares_extractor.wares.get(ware_id.lower())
-    if not game_ware or not game_ware.default_method:
-        raise ValueError(f"No game production data for '{ware_id}' - may not be a producible ware")
+    current_stats, method = _resolve_expansion(ware_id, wares_extractor, analyzer)
 
     # Calculate new production rate
-    method = game_ware.default_method
     module_rate = method.units_per_hour
     current_rate = current_stats.production_rate_per_hour
     planned_rate = current_rate + (additional_modules * module_rate)
@@ -111,6 +196,7 @@ def calculate_expansion_impact(
     # Analyze each input requirement
     input_requirements = []
     bottlenecks = []
+    stats_cache: Dict[str, object] = {}
 
     for resource in method.resources:
         input_req = _analyze_input_requirement(
@@ -118,7 +204,8 @@ def calculate_expansion_impact(
             resource.amount,
             additional_modules,
             method,
-            analyzer
+            analyzer,
+            stats_cache
         )
         input_requirements.append(input_req)
 
@@ -127,7 +214,8 @@ def calculate_expansion_impact(
                 input_req.ware,
                 abs(input_req.surplus_or_deficit),
                 wares_extractor,
-                analyzer
+                analyzer,
+                stats_cache
             )
             bottlenecks.append(bottleneck)
 
@@ -150,9 +238,9 @@ def calculate_expansion_impact(
         planned_rate=planned_rate,
         increase_amount=increase_amount,
         increase_percent=increase_percent,
-        input_requirements=input_requirements,
-        bottlenecks=bottlenecks,
-        recommendations=recommendations,
+        input_requirements=tuple(input_requirements),
+        bottlenecks=tuple(bottlenecks),
+        recommendations=tuple(recommendations),
         is_feasible=is_feasible
     )
 
@@ -162,7 +250,8 @@ def _analyze_input_requirement(
     amount_per_cycle: int,
     additional_modules: int,
     production_method,
-    analyzer
+    analyzer,
+    stats_cache: Dict[str, object]
 ) -> InputRequirement:
     """
     Analyze a single input requirement for the expansion.
@@ -174,7 +263,7 @@ def _analyze_input_requirement(
     delta_consumption = additional_modules * consumption_per_module
 
     # Get current state of this input ware
-    input_stats = analyzer.get_ware_stats(input_ware_id)
+    input_stats = _lookup_stats(analyzer, input_ware_id, stats_cache)
 
     if input_stats:
         current_consumption = input_stats.consumption_rate_per_hour
@@ -184,7 +273,33 @@ def _analyze_input_requirement(
         current_consumption = 0.0
         your_production = 0.0
 
-    new_consumption = current_consumption + delta_consumption
+    your_net_available, surplus_or_deficit, status = _classify_input_balance(
+        your_production, current_consumption, delta_consumption
+    )
+
+    return InputRequirement(
+        ware=ware,
+        current_consumption=current_consumption,
+        new_consumption=current_consumption + delta_consumption,
+        delta_consumption=delta_consumption,
+        your_production=your_production,
+        your_net_available=your_net_available,
+        status=status,
+        surplus_or_deficit=surplus_or_deficit
+    )
+
+
+def _classify_input_balance(
+    your_production: float,
+    current_consumption: float,
+    delta_consumption: float
+) -> Tuple[float, float, str]:
+    """
+    Classify an input ware's supply after expansion.
+
+    Returns:
+        (net available now, surplus or deficit after expansion, status)
+    """
     your_net_available = your_production - current_consumption
     surplus_or_deficit = your_net_available - delta_consumption
 
@@ -196,30 +311,22 @@ def _analyze_input_requirement(
     else:
         status = "sufficient"
 
-    return InputRequirement(
-        ware=ware,
-        current_consumption=current_consumption,
-        new_consumption=new_consumption,
-        delta_consumption=delta_consumption,
-        your_production=your_production,
-        your_net_available=your_net_available,
-        status=status,
-        surplus_or_deficit=surplus_or_deficit
-    )
+    return your_net_available, surplus_or_deficit, status
 
 
 def _create_bottleneck(
     ware: Ware,
     deficit: float,
     wares_extractor,
-    analyzer
+    analyzer,
+    stats_cache: Dict[str, object]
 ) -> Bottleneck:
     """Create bottleneck analysis with solution options."""
     solutions = []
-    ware_id = ware.ware_id.lower()
+    ware_id = ware.ware_id_lower
 
     # Get current production to calculate severity
-    input_stats = analyzer.get_ware_stats(ware_id)
+    input_stats = _lookup_stats(analyzer, ware_id, stats_cache)
     current_production = input_stats.production_rate_per_hour if input_stats else 0.0
 
     # Calculate severity based on deficit vs total needed
@@ -235,41 +342,35 @@ def _create_bottleneck(
 
     # Solution 1: Expand production (if producible)
     game_ware = wares_extractor.wares.get(ware_id)
-    if game_ware and game_ware.default_method:
-        module_output = game_ware.default_method.units_per_hour
-        modules_needed = math.ceil(deficit / module_output) if module_output > 0 else 1
+    method = game_ware.default_method if game_ware else None
+    if method:
+        # default_method scans production_methods, so bind it once
+        module_output = method.units_per_hour
+        modules_needed = int(-(-deficit // module_output)) if module_output > 0 else 1
 
         # Check if expanding this would create secondary bottlenecks
-        blocking_issues = []
-        for resource in game_ware.default_method.resources:
-            res_stats = analyzer.get_ware_stats(resource.ware_id)
-            if res_stats:
-                res_available = res_stats.production_rate_per_hour - res_stats.consumption_rate_per_hour
-                res_needed = modules_needed * game_ware.default_method.resource_per_hour(resource.ware_id)
-                if res_available < res_needed:
-                    res_ware = get_ware(resource.ware_id)
-                    blocking_issues.append(f"{res_ware.name} also needs expansion")
+        blocking_issues = _find_secondary_bottlenecks(method, modules_needed, analyzer)
 
         solutions.append(BottleneckSolution(
             solution_type="expand_production",
             description=f"Add {modules_needed} {ware.name} production module{'s' if modules_needed > 1 else ''}",
             modules_needed=modules_needed,
             is_feasible=len(blocking_issues) == 0,
-            blocking_issues=blocking_issues
+            blocking_issues=tuple(blocking_issues)
         ))
 
     # Solution 2: Mining (if raw material)
     if is_raw_material(ware_id):
         # Rough estimate: average miner ~10,000 units/hr throughput
         avg_miner_throughput = 10000
-        miners_needed = math.ceil(deficit / avg_miner_throughput)
+        miners_needed = int(-(-deficit // avg_miner_throughput))
 
         solutions.append(BottleneckSolution(
             solution_type="assign_miners",
             description=f"Assign {miners_needed} additional miner{'s' if miners_needed > 1 else ''} for {ware.name}",
             miners_needed=miners_needed,
             is_feasible=True,
-            blocking_issues=["Requires available miners in fleet"]
+            blocking_issues=("Requires available miners in fleet",)
         ))
 
     # Solution 3: Market purchase (always available)
@@ -277,47 +378,55 @@ def _create_bottleneck(
         solution_type="purchase_market",
         description=f"Purchase ~{int(deficit):,}/hr from NPC stations",
         is_feasible=True,
-        blocking_issues=["Ongoing cost - not self-sufficient"]
+        blocking_issues=("Ongoing cost - not self-sufficient",)
     ))
 
-    # Recommend best solution
-    recommended = _recommend_solution(solutions)
+    # Recommend best solution (at most one solution of each type)
+    recommended = _recommend_solution({sol.solution_type: sol for sol in solutions})
 
     return Bottleneck(
         ware=ware,
         deficit=deficit,
         severity=severity,
-        solutions=solutions,
+        solutions=tuple(solutions),
         recommended_solution=recommended
     )
 
 
-def _recommend_solution(solutions: List[BottleneckSolution]) -> Optional[BottleneckSolution]:
+def _find_secondary_bottlenecks(method, modules_needed: int, analyzer) -> List[str]:
+    """List the inputs whose spare supply can't cover the added modules."""
+    net_available = analyzer.net_available
+    resource_per_hour = method.resource_per_hour
+    return [
+        f"{get_ware(res_id).name} also needs expansion"
+        for res_id, available in (
+            (resource.ware_id, net_available(resource.ware_id)) for resource in method.resources
+        )
+        # Wares we neither produce nor consume have no tracked supply to check
+        if available is not None and available < modules_needed * resource_per_hour(res_id)
+    ]
+
+
+def _recommend_solution(
+    solution_map: Dict[str, BottleneckSolution]
+) -> Optional[BottleneckSolution]:
     """
-    Recommend best solution.
+    Recommend best solution from solutions keyed by solution_type.
     Priority: feasible production > mining > non-feasible production > market
     """
-    # Feasible production expansion
-    for sol in solutions:
-        if sol.solution_type == "expand_production" and sol.is_feasible:
-            return sol
-
-    # Mining
-    for sol in solutions:
-        if sol.solution_type == "assign_miners":
-            return sol
-
-    # Non-feasible production (still better long-term than market)
-    for sol in solutions:
-        if sol.solution_type == "expand_production":
-            return sol
+    production = solution_map.get("expand_production")
 
-    # Market as last resort
-    for sol in solutions:
-        if sol.solution_type == "purchase_market":
-            return sol
-
-    return None
+    # Feasible production expansion
+    if production and production.is_feasible:
+        return production
+
+    # Mining, then non-feasible production (still better long-term than market),
+    # then market as last resort
+    return (
+        solution_map.get("assign_miners")
+        or production
+        or solution_map.get("purchase_market")
+    )
 
 
 def _generate_recommendations(
@@ -330,35 +439,31 @@ def _generate_recommendations(
     recommendations = []
 
     if not bottlenecks:
-        recommendations.append(
-            "Expansion is feasible - all input requirements can be met"
-        )
-        recommendations.append(
-            f"You can safely add {additional_modules} {target_ware.name} module{'s' if additional_modules > 1 else ''}"
-        )
+        plural = "s" if additional_modules > 1 else ""
+        recommendations.extend((
+            "Expansion is feasible - all input requirements can be met",
+            f"You can safely add {additional_modules} {target_ware.name} module{plural}",
+        ))
     else:
-        recommendations.append(
-            f"{len(bottlenecks)} bottleneck{'s' if len(bottlenecks) > 1 else ''} must be resolved first:"
-        )
+        bottleneck_count = len(bottlenecks)
+        plural = "s" if bottleneck_count > 1 else ""
+        recommendations.append(f"{bottleneck_count} bottleneck{plural} must be resolved first:")
 
         for bottleneck in bottlenecks:
-            if bottleneck.recommended_solution:
-                sol = bottleneck.recommended_solution
-                rec = f"  {bottleneck.ware.name}: {sol.description}"
-                recommendations.append(rec)
+            sol = bottleneck.recommended_solution
+            if sol:
+                recommendations.append(f"  {bottleneck.ware.name}: {sol.description}")
 
                 if not sol.is_feasible and sol.blocking_issues:
-                    for issue in sol.blocking_issues:
-                        recommendations.append(f"    (Note: {issue})")
+                    recommendations.extend(f"    (Note: {issue})" for issue in sol.blocking_issues)
 
     # Highlight marginal inputs
     marginal = [r for r in input_requirements if r.status == "marginal"]
     if marginal:
-        recommendations.append("")
-        recommendations.append("Marginal supplies (tight buffer):")
-        for req in marginal:
-            recommendations.append(
-                f"  {req.ware.name}: only {req.surplus_or_deficit:,.0f}/hr surplus after expansion"
-            )
+        recommendations.extend(("", "Marginal supplies (tight buffer):"))
+        recommendations.extend(
+            f"  {req.ware.name}: only {req.surplus_or_deficit:,.0f}/hr surplus after expansion"
+            for req in marginal
+        )
 
     return recommendations
@@ -1,11 +1,14 @@
 """Production analysis and statistics."""
 
 import logging
-from typing import Any, Dict, List, Optional
-from collections import defaultdict
+from bisect import bisect_left
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Optional, Tuple
+from collections import Counter, defaultdict
 
 from ..models.entities import (
-    EmpireData, Station, ProductionModule, Ware, WareCategory
+    DATACLASS_SLOTS, EmpireData, Station, ProductionModule, Ship, ShipPurpose, Ware, WareCategory
 )
 from ..models.ware_database import get_ware
 
@@ -21,6 +24,14 @@ SUPPLY_SHORTAGE_THRESHOLD = 1.2
 STORAGE_SURPLUS_THRESHOLD = 80  # Below 80% utilization = surplus
 STORAGE_SHORTAGE_THRESHOLD = 120  # Above 120% utilization = shortage
 
+# Status names for threshold bands, indexed by how many thresholds are crossed
+# (lowest band first; see _compute_supply_status and mining_coverage_status)
+SUPPLY_STATUS_BANDS = ("Surplus", "Balanced", "Shortage")
+MINING_COVERAGE_BANDS = ("Insufficient", "Marginal", "Sufficient")
+
+# Station types that build ships or equipment
+SHIP_BUILDER_TYPES = frozenset({"wharf", "shipyard", "equipmentdock"})
+
 # Mining capacity thresholds (cargo capacity vs consumption rate)
 # Sufficient: cargo capacity >= consumption/hr * 1.5 (miners have buffer capacity)
 MINING_SUFFICIENT_MULTIPLIER = 1.5
@@ -28,21 +39,50 @@ MINING_SUFFICIENT_MULTIPLIER = 1.5
 MINING_MARGINAL_MULTIPLIER = 1.0
 
 
+@dataclass(**DATACLASS_SLOTS)
+class StationWareRate:
+    """Rate of a single ware produced or consumed at a station."""
+    ware: str  # Display name
+    ware_id: str
+    rate: float  # Units/hour
+    modules: int = 0  # Production modules making this ware (produced wares only)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class StationNetRate:
+    """Net rate of a single ware at a station."""
+    ware: str  # Display name
+    net_rate: float  # production - consumption (units/hour)
+    production: float
+    consumption: float
+
+
 class ProductionStats:
     """Statistics for a specific ware production."""
 
+    # One instance per ware; slots keep them small and attribute access fast
+    __slots__ = (
+        "ware", "module_count", "total_stock", "total_capacity", "_capacity_percent",
+        "total_production_output", "total_consumption_demand", "_production_utilization",
+        "consuming_stations", "producing_stations",
+        "production_rate_per_hour", "consumption_rate_per_hour", "has_rate_data",
+        "station_production_rates", "station_consumption_rates",
+        "mining_ship_count", "mining_cargo_capacity", "_supply_status", "_mining_status",
+    )
+
     def __init__(self, ware: Ware):
         self.ware = ware
         self.module_count = 0
         self.total_stock = 0
         self.total_capacity = 0
-        self.modules: List[ProductionModule] = []
+        self._capacity_percent = 0.0  # Kept in step with stock/capacity by add_module
 
         # Supply/Demand tracking (storage-based estimates)
         self.total_production_output = 0  # Sum of production capacity (estimate)
         self.total_consumption_demand = 0  # Sum of buy orders from all stations (estimate)
-        self.consuming_stations: Dict[str, int] = {}  # station_name -> demand amount (storage-based)
-        self.producing_stations: Dict[str, int] = {}  # station_name -> module count
+        self._production_utilization = 0.0  # Kept in step with the totals above
+        self.consuming_stations: Dict[str, int] = Counter()  # station_name -> demand amount (storage-based)
+        self.producing_stations: Dict[str, int] = Counter()  # station_name -> module count
 
         # True production rates (from game data)
         self.production_rate_per_hour: float = 0.0  # Total units/hour produced empire-wide
@@ -57,23 +97,42 @@ class ProductionStats:
         self.mining_ship_count: int = 0  # Number of miners assigned to stations consuming this ware
         self.mining_cargo_capacity: int = 0  # Total cargo capacity of those miners
 
+        # Cached supply_status and mining_coverage_status; reset by
+        # _invalidate_status() when inputs change
+        self._supply_status: Optional[str] = None
+        self._mining_status: Optional[str] = None
+
     @property
     def capacity_percent(self) -> float:
-        """Calculate overall stock vs capacity utilization (storage fill level)."""
-        if self.total_capacity == 0:
-            return 0.0
-        return (self.total_stock / self.total_capacity) * 100
+        """Overall stock vs capacity utilization (storage fill level)."""
+        return self._capacity_percent
 
     @property
     def production_utilization(self) -> float:
-        """Calculate consumption vs production utilization (supply/demand balance)."""
-        if self.total_production_output == 0:
-            return 0.0
-        return (self.total_consumption_demand / self.total_production_output) * 100
+        """Consumption vs production utilization (supply/demand balance)."""
+        return self._production_utilization
+
+    def _update_production_utilization(self):
+        """Recompute utilization after production output or consumption demand changes."""
+        self._production_utilization = (
+            (self.total_consumption_demand / self.total_production_output) * 100
+            if self.total_production_output else 0.0
+        )
 
     @property
     def supply_status(self) -> str:
-        """Get supply status: Surplus, Balanced, or Shortage."""
+        """Get supply status: Surplus, Balanced, or Shortage (cached)."""
+        if self._supply_status is None:
+            self._supply_status = self._compute_supply_status()
+        return self._supply_status
+
+    def _invalidate_status(self):
+        """Drop the cached statuses after totals, rates or mining data change."""
+        self._supply_status = None
+        self._mining_status = None
+
+    def _compute_supply_status(self) -> str:
+        """Work out the supply status from storage or rate data."""
         # Use rate-based calculation if available
         if self.has_rate_data:
             return self._rate_based_supply_status()
@@ -99,13 +158,10 @@ class ProductionStats:
                 return "Surplus"  # Producing but no internal demand
             return "No Demand"
 
-        util = self.production_utilization
-        if util < STORAGE_SURPLUS_THRESHOLD:
-            return "Surplus"
-        elif util <= STORAGE_SHORTAGE_THRESHOLD:
-            return "Balanced"
-        else:
-            return "Shortage"
+        util = self._production_utilization
+        return SUPPLY_STATUS_BANDS[
+            (util >= STORAGE_SURPLUS_THRESHOLD) + (util > STORAGE_SHORTAGE_THRESHOLD)
+        ]
 
     def _rate_based_supply_status(self) -> str:
         """Get supply status based on actual production rates."""
@@ -127,12 +183,9 @@ class ProductionStats:
 
         # Calculate ratio of consumption to production (safe - checked above)
         ratio = self.consumption_rate_per_hour / self.production_rate_per_hour
-        if ratio < SUPPLY_SURPLUS_THRESHOLD:
-            return "Surplus"
-        elif ratio <= SUPPLY_SHORTAGE_THRESHOLD:
-            return "Balanced"
-        else:
-            return "Shortage"
+        return SUPPLY_STATUS_BANDS[
+            (ratio >= SUPPLY_SURPLUS_THRESHOLD) + (ratio > SUPPLY_SHORTAGE_THRESHOLD)
+        ]
 
     @property
     def rate_balance(self) -> float:
@@ -142,34 +195,37 @@ class ProductionStats:
     def add_module(self, module: ProductionModule, station_name: str = "Unknown"):
         """Add a module to the stats."""
         self.module_count += 1
-        self.modules.append(module)
 
         if module.output:
             self.total_stock += module.output.amount
             self.total_capacity += module.output.capacity
+            self._capacity_percent = (
+                (self.total_stock / self.total_capacity) * 100 if self.total_capacity else 0.0
+            )
             # Estimate production output from capacity (or use stock * 2 as estimate)
             production_estimate = module.output.capacity if module.output.capacity > 0 else 10000
             self.total_production_output += production_estimate
         else:
             # Module with no trade data - estimate default production
             self.total_production_output += 10000
+        self._update_production_utilization()
+        self._supply_status = None
 
         # Track producing station
-        if station_name not in self.producing_stations:
-            self.producing_stations[station_name] = 0
         self.producing_stations[station_name] += 1
 
     def add_consumption(self, station_name: str, demand_amount: int):
         """Add consumption demand from a station."""
         self.total_consumption_demand += demand_amount
-        if station_name not in self.consuming_stations:
-            self.consuming_stations[station_name] = 0
+        self._update_production_utilization()
         self.consuming_stations[station_name] += demand_amount
+        self._supply_status = None
 
     def add_mining_capacity(self, ship_count: int, cargo_capacity: int):
         """Add mining capacity from miners assigned to stations consuming this ware."""
         self.mining_ship_count += ship_count
         self.mining_cargo_capacity += cargo_capacity
+        self._invalidate_status()
 
     @property
     def mining_coverage_status(self) -> str:
@@ -187,6 +243,12 @@ class ProductionStats:
         The cargo capacity comparison provides a rough ballpark estimate assuming
         miners can complete ~1-2 round trips per hour with full loads.
         """
+        if self._mining_status is None:
+            self._mining_status = self._compute_mining_coverage_status()
+        return self._mining_status
+
+    def _compute_mining_coverage_status(self) -> str:
+        """Work out the mining coverage status from miner and consumption data."""
         if self.mining_ship_count == 0:
             return "No Miners"
 
@@ -195,12 +257,12 @@ class ProductionStats:
             return f"{self.mining_ship_count} miners"
 
         # Compare mining capacity to consumption rate using threshold constants
-        if self.mining_cargo_capacity >= self.consumption_rate_per_hour * MINING_SUFFICIENT_MULTIPLIER:
-            return "Sufficient"
-        elif self.mining_cargo_capacity >= self.consumption_rate_per_hour * MINING_MARGINAL_MULTIPLIER:
-            return "Marginal"
-        else:
-            return "Insufficient"
+        capacity = self.mining_cargo_capacity
+        rate = self.consumption_rate_per_hour
+        return MINING_COVERAGE_BANDS[
+            (capacity >= rate * MINING_MARGINAL_MULTIPLIER)
+            + (capacity >= rate * MINING_SUFFICIENT_MULTIPLIER)
+        ]
 
     def get_station_production_rate(self, station_name: str) -> float:
         """Get production rate for a specific station (units/hour)."""
@@ -221,6 +283,34 @@ class ProductionAnalyzer:
     def __init__(self, empire: EmpireData):
         self.empire = empire
         self._production_stats: Dict[Ware, ProductionStats] = {}
+        # Lookup indices for get_ware_stats(), kept in sync by _register_stats()
+        self._by_ware_id_lower: Dict[str, ProductionStats] = {}
+        self._by_name_lower: Dict[str, ProductionStats] = {}
+        # Number of stats with game-data rates applied (see has_rate_data)
+        self._rate_data_count = 0
+        # Cached query results, rebuilt on demand after _invalidate_views()
+        # (shortages, surplus, by_category) from _partition_stats()
+        self._partitions: Optional[Tuple[
+            List[ProductionStats], List[ProductionStats], Dict[WareCategory, List[ProductionStats]]
+        ]] = None
+        self._all_sorted: Optional[List[ProductionStats]] = None
+        # Stats with storage capacity sorted by fill level, plus their fill
+        # percentages as a parallel list so bottleneck queries can bisect
+        self._stocked_by_fill: Optional[Tuple[List[float], List[ProductionStats]]] = None
+        self._stations_by_product_count: Optional[List[Tuple[int, Station]]] = None
+        # Station groupings and assigned-ship totals, filled by the _analyze station walk
+        self._stations_by_type: Dict[str, List[Station]] = {}
+        self._ship_builders: List[Station] = []
+        self._station_logistics: Dict[str, int] = {}
+        # (lowercased name, lowercased ware_id, stats) for search_production
+        self._search_entries: Optional[List[Tuple[str, str, ProductionStats]]] = None
+        # Queried ware ID -> production minus consumption rate (None if not tracked)
+        self._net_available: Dict[str, Optional[float]] = {}
+        # Station name -> stats produced/consumed there (for analyze_dependencies)
+        self._produced_at_station: Optional[Dict[str, List[ProductionStats]]] = None
+        self._consumed_at_station: Optional[Dict[str, List[ProductionStats]]] = None
+        # Target ware -> analyze_dependencies() result
+        self._dependencies: Dict[Ware, Dict[str, List[ProductionStats]]] = {}
         self._analyze()
 
     # Define which raw materials can be mined by which cargo type
@@ -237,67 +327,154 @@ class ProductionAnalyzer:
         "ice": "liquid",  # Ice is typically collected by gas miners
     }
 
+    def _register_stats(self, stats: ProductionStats) -> ProductionStats:
+        """Store stats for a ware and add them to the lookup indices."""
+        ware = stats.ware
+        replaced = self._production_stats.get(ware)
+        self._production_stats[ware] = stats
+        for index, key in (
+            (self._by_ware_id_lower, ware.ware_id_lower),
+            (self._by_name_lower, ware.name.lower()),
+        ):
+            # First registered wins, matching the order of the old linear scan,
+            # but stats that replace an entry also take over its index slots
+            current = index.get(key)
+            if current is None or current is replaced:
+                index[key] = stats
+        self._invalidate_views()
+        return stats
+
+    def _invalidate_views(self):
+        """Drop cached query results after production stats or rates change."""
+        self._partitions = None
+        self._all_sorted = None
+        self._stocked_by_fill = None
+        self._search_entries = None
+        self._net_available = {}
+        self._produced_at_station = None
+        self._consumed_at_station = None
+        self._dependencies = {}
+
     def _analyze(self):
         """Perform initial analysis of production data."""
-        # First pass: Build production statistics
+        # Single station walk: build production statistics, collect each
+        # station's input demands and miners, and group stations / total
+        # assigned ships for the station and logistics getters. Demands are
+        # applied afterwards so produced wares are registered ahead of
+        # consumed-only wares, and mining capacity needs the consumers.
+        # One stats lookup per module (Ware hashing is not free on large empires)
+        production_stats = self._production_stats
+        station_demands: List[Tuple[str, Dict[str, int]]] = []
+        station_miners: List[Tuple[str, List[Ship]]] = []
+        by_type: Dict[str, List[Station]] = defaultdict(list)
+        ship_builders: List[Station] = []
+        logistics = self._new_ship_totals()
         for station in self.empire.stations:
-            for module in station.production_modules:
-                if module.output_ware:
-                    if module.output_ware not in self._production_stats:
-                        self._production_stats[module.output_ware] = ProductionStats(module.output_ware)
-
-                    self._production_stats[module.output_ware].add_module(module, station.name)
+            station_name = station.name
+            by_type[station.station_type].append(station)
+            if station.station_type in SHIP_BUILDER_TYPES:
+                ship_builders.append(station)
+            self._tally_ships(station.assigned_ships, logistics)
 
-        # Second pass: Track consumption demand from all stations
-        self._analyze_consumption()
+            for module in station.production_modules:
+                ware = module.output_ware
+                if ware:
+                    stats = production_stats.get(ware)
+                    if stats is None:
+                        stats = self._register_stats(ProductionStats(ware))
+                    stats.add_module(module, station_name)
+            if station.input_demands:
+                station_demands.append((station_name, station.input_demands))
+            miners = station.miners
+            if miners:
+                station_miners.append((station_name, miners))
+
+        self._stations_by_type = dict(by_type)
+        self._ship_builders = ship_builders
+        self._station_logistics = logistics
+
+        # Track consumption demand from all stations
+        self._analyze_consumption(station_demands)
+
+        # Track mining capacity for raw materials
+        self._analyze_mining_capacity(station_miners)
+
+    @staticmethod
+    def _new_ship_totals() -> Dict[str, int]:
+        """Empty totals for _tally_ships()."""
+        return {"ships": 0, "traders": 0, "miners": 0, "cargo": 0, "trader_cargo": 0}
+
+    @staticmethod
+    def _tally_ships(ships: List[Ship], totals: Dict[str, int]) -> Dict[str, int]:
+        """Add ship, trader and miner counts and cargo capacity to running totals."""
+        totals["ships"] += len(ships)
+        for ship in ships:
+            totals["cargo"] += ship.cargo_capacity
+            if ship.ship_purpose == ShipPurpose.TRADER:
+                totals["traders"] += 1
+                totals["trader_cargo"] += ship.cargo_capacity
+            elif ship.ship_purpose == ShipPurpose.MINER:
+                totals["miners"] += 1
+        return totals
+
+    def _analyze_consumption(self, station_demands: List[Tuple[str, Dict[str, int]]]):
+        """
+        Analyze consumption demand across all stations.
 
-        # Third pass: Track mining capacity for raw materials
-        self._analyze_mining_capacity()
+        Args:
+            station_demands: (station name, input demands) for each station with demands
+        """
+        # The same input wares recur across stations; resolve each ID once
+        ware_cache: Dict[str, Ware] = {}
+        production_stats = self._production_stats
 
-    def _analyze_consumption(self):
-        """Analyze consumption demand across all stations."""
-        for station in self.empire.stations:
+        for station_name, input_demands in station_demands:
             # Collect input demands from station's trade data
             # This captures consumption from wharfs/shipyards/equipment docks
             # Note: Production module input requirements are calculated from game data
             # in _calculate_all_consumption_rates() for more accurate rate-based analysis
             station_inputs: Dict[str, int] = {}  # ware_id -> total demand
 
-            for ware_id, demand in station.input_demands.items():
-                if ware_id not in station_inputs:
-                    station_inputs[ware_id] = 0
-                station_inputs[ware_id] = max(station_inputs[ware_id], demand)
+            for ware_id, demand in input_demands.items():
+                station_inputs[ware_id] = max(station_inputs.get(ware_id, 0), demand)
 
             # Add consumption to production stats for each input ware
             for ware_id, demand in station_inputs.items():
-                ware = get_ware(ware_id)
-                if ware not in self._production_stats:
+                ware = ware_cache.get(ware_id)
+                if ware is None:
+                    ware = ware_cache[ware_id] = get_ware(ware_id)
+                stats = production_stats.get(ware)
+                if stats is None:
                     # Create production stats for wares we consume but don't produce
                     # This includes raw materials, wares consumed by wharfs/shipyards, etc.
-                    self._production_stats[ware] = ProductionStats(ware)
-                self._production_stats[ware].add_consumption(station.name, demand)
+                    stats = self._register_stats(ProductionStats(ware))
+                stats.add_consumption(station_name, demand)
 
-    def _analyze_mining_capacity(self):
+    def _analyze_mining_capacity(self, station_miners: List[Tuple[str, List[Ship]]]):
         """
         Analyze mining capacity for raw materials.
 
         For each raw material, count the miners assigned to stations that consume it,
         and sum up their cargo capacity.
+
+        Args:
+            station_miners: (station name, assigned miners) for each station with miners
         """
-        # Track which stations consume which raw materials
-        raw_material_consumers: Dict[str, List[str]] = {}  # ware_id -> list of station_names
+        if not station_miners:
+            return
+
+        # Track which raw materials each station consumes
+        raw_materials_by_station: Dict[str, List[ProductionStats]] = defaultdict(list)
 
         for stats in self._production_stats.values():
             if stats.ware.category == WareCategory.RAW:
-                ware_id = stats.ware.ware_id.lower()
-                raw_material_consumers[ware_id] = list(stats.consuming_stations.keys())
+                for station_name in stats.consuming_stations:
+                    raw_materials_by_station[station_name].append(stats)
 
         # For each station, check if it has miners that can supply its raw material needs
-        for station in self.empire.stations:
-            # Get miners at this station
-            miners = station.miners
-
-            if not miners:
+        for station_name, miners in station_miners:
+            raw_materials = raw_materials_by_station.get(station_name)
+            if not raw_materials:
                 continue
 
             # Categorize miners by cargo type
@@ -305,75 +482,91 @@ class ProductionAnalyzer:
             liquid_miners = []
 
             for miner in miners:
-                cargo_tags = miner.cargo_tags.lower() if miner.cargo_tags else ""
-                if "solid" in cargo_tags:
+                if miner.mining_cargo_type == "solid":
                     solid_miners.append(miner)
-                elif "liquid" in cargo_tags or "gas" in cargo_tags:
-                    liquid_miners.append(miner)
                 else:
-                    # Unknown type - check macro for hints
-                    macro = miner.ship_class.lower()
-                    if "liquid" in macro or "gas" in macro:
-                        liquid_miners.append(miner)
-                    else:
-                        solid_miners.append(miner)  # Default to solid
+                    liquid_miners.append(miner)
 
             # For each raw material this station consumes, add mining capacity
-            for ware_id, consuming_stations in raw_material_consumers.items():
-                if station.name not in consuming_stations:
-                    continue
-
+            for stats in raw_materials:
                 # Determine which miners can supply this raw material
-                cargo_type = self.RAW_MATERIAL_CARGO_TYPES.get(ware_id, "solid")
+                cargo_type = self.RAW_MATERIAL_CARGO_TYPES.get(stats.ware.ware_id_lower, "solid")
                 relevant_miners = solid_miners if cargo_type == "solid" else liquid_miners
 
                 if relevant_miners:
-                    ware = get_ware(ware_id)
-                    if ware in self._production_stats:
-                        total_cargo = sum(m.cargo_capacity for m in relevant_miners)
-                        self._production_stats[ware].add_mining_capacity(
-                            len(relevant_miners), total_cargo
-                        )
+                    total_cargo = sum(m.cargo_capacity for m in relevant_miners)
+                    stats.add_mining_capacity(len(relevant_miners), total_cargo)
 
-    def get_supply_shortages(self) -> List[ProductionStats]:
-        """Get wares with supply shortages (demand exceeds production)."""
-        shortages = []
-        for stats in self._production_stats.values():
-            if stats.supply_status == "Shortage":
-                shortages.append(stats)
-        return sorted(shortages, key=lambda s: s.production_utilization, reverse=True)
+    def _partition_stats(self) -> Tuple[
+        List[ProductionStats], List[ProductionStats], Dict[WareCategory, List[ProductionStats]]
+    ]:
+        """
+        Bucket stats by supply status and category in a single pass.
 
-    def get_supply_surplus(self) -> List[ProductionStats]:
-        """Get wares with surplus production."""
-        surplus = []
-        for stats in self._production_stats.values():
-            if stats.supply_status == "Surplus":
-                surplus.append(stats)
-        return sorted(surplus, key=lambda s: s.production_utilization)
+        Returns (shortages, surplus, by_category), cached until _invalidate_views().
+        """
+        if self._partitions is None:
+            shortages = []
+            surplus = []
+            by_category = defaultdict(list)
 
-    def get_production_by_category(self) -> Dict[WareCategory, List[ProductionStats]]:
-        """Group production stats by ware category."""
-        by_category = defaultdict(list)
+            for stats in self._production_stats.values():
+                status = stats.supply_status
+                if status == "Shortage":
+                    shortages.append(stats)
+                elif status == "Surplus":
+                    surplus.append(stats)
+                by_category[stats.ware.category].append(stats)
 
-        for stats in self._production_stats.values():
-            by_category[stats.ware.category].append(stats)
+            shortages.sort(key=attrgetter("_production_utilization"), reverse=True)
+            surplus.sort(key=attrgetter("_production_utilization"))
+            # Sort each category by module count (descending)
+            for category_stats in by_category.values():
+                category_stats.sort(key=attrgetter("module_count"), reverse=True)
+
+            self._partitions = (shortages, surplus, dict(by_category))
 
-        # Sort each category by module count (descending)
-        for category in by_category:
-            by_category[category].sort(key=lambda s: s.module_count, reverse=True)
+        return self._partitions
 
-        return dict(by_category)
+    def get_supply_shortages(self) -> List[ProductionStats]:
+        """Get wares where demand exceeds production (cached, do not mutate)."""
+        return self._partition_stats()[0]
+
+    def get_supply_surplus(self) -> List[ProductionStats]:
+        """Get wares with surplus production (cached, do not mutate)."""
+        return self._partition_stats()[1]
+
+    def get_production_by_category(self) -> Dict[WareCategory, List[ProductionStats]]:
+        """Group production stats by ware category (cached, do not mutate)."""
+        return self._partition_stats()[2]
 
     def get_all_production_stats(self) -> List[ProductionStats]:
-        """Get all production stats sorted by module count."""
-        return sorted(self._production_stats.values(), key=lambda s: s.module_count, reverse=True)
+        """Get all production stats sorted by module count (cached, do not mutate)."""
+        if self._all_sorted is None:
+            self._all_sorted = sorted(
+                self._production_stats.values(), key=attrgetter("module_count"), reverse=True
+            )
+        return self._all_sorted
 
     def get_ware_stats(self, ware_id: str) -> Optional[ProductionStats]:
-        """Get statistics for a specific ware."""
-        for stats in self._production_stats.values():
-            if stats.ware.ware_id == ware_id or stats.ware.name.lower() == ware_id.lower():
-                return stats
-        return None
+        """Get statistics for a specific ware by ID or display name (case-insensitive)."""
+        key = ware_id.lower()
+        return self._by_ware_id_lower.get(key) or self._by_name_lower.get(key)
+
+    def net_available(self, ware_id: str) -> Optional[float]:
+        """
+        Get a ware's spare production rate (units/hour produced minus consumed).
+
+        Returns None if the ware is not produced or consumed in the empire.
+        """
+        try:
+            return self._net_available[ware_id]
+        except KeyError:
+            pass
+        stats = self.get_ware_stats(ware_id)
+        net = stats.production_rate_per_hour - stats.consumption_rate_per_hour if stats else None
+        self._net_available[ware_id] = net
+        return net
 
     def get_most_produced(self, limit: int = 5) -> List[ProductionStats]:
         """Get top N most produced wares."""
@@ -382,11 +575,18 @@ class ProductionAnalyzer:
 
     def get_diverse_stations(self, min_products: int = 3) -> List[Station]:
         """Get stations that produce multiple different products."""
+        if self._stations_by_product_count is None:
+            # Stations don't change after parsing, so sort them once
+            counted = [(len(station.unique_products), station) for station in self.empire.stations]
+            counted.sort(key=itemgetter(0), reverse=True)
+            self._stations_by_product_count = counted
+
         diverse = []
-        for station in self.empire.stations:
-            if len(station.unique_products) >= min_products:
-                diverse.append(station)
-        return sorted(diverse, key=lambda s: len(s.unique_products), reverse=True)
+        for product_count, station in self._stations_by_product_count:
+            if product_count < min_products:
+                break
+            diverse.append(station)
+        return diverse
 
     def get_potential_bottlenecks(self, stock_threshold: float = 30.0) -> List[ProductionStats]:
         """
@@ -398,11 +598,30 @@ class ProductionAnalyzer:
         Returns:
             List of production stats with low stock
         """
-        bottlenecks = []
+        if self._stocked_by_fill is None:
+            stocked = sorted(
+                (stats for stats in self._production_stats.values() if stats.total_capacity > 0),
+                key=attrgetter("_capacity_percent")
+            )
+            self._stocked_by_fill = ([stats._capacity_percent for stats in stocked], stocked)
+
+        fill_levels, stocked = self._stocked_by_fill
+        return stocked[:bisect_left(fill_levels, stock_threshold)]
+
+    def _build_station_index(self):
+        """Index which wares are produced and consumed at each station."""
+        produced_at: Dict[str, List[ProductionStats]] = defaultdict(list)
+        consumed_at: Dict[str, List[ProductionStats]] = defaultdict(list)
+
         for stats in self._production_stats.values():
-            if stats.total_capacity > 0 and stats.capacity_percent < stock_threshold:
-                bottlenecks.append(stats)
-        return sorted(bottlenecks, key=lambda s: s.capacity_percent)
+            for station_name in stats.station_production_rates:
+                produced_at[station_name].append(stats)
+            for station_name, cons_rate in stats.station_consumption_rates.items():
+                if cons_rate > 0:
+                    consumed_at[station_name].append(stats)
+
+        self._produced_at_station = dict(produced_at)
+        self._consumed_at_station = dict(consumed_at)
 
     def analyze_dependencies(self, ware_id: str) -> Dict[str, List[ProductionStats]]:
         """
@@ -411,63 +630,61 @@ class ProductionAnalyzer:
         Uses consumption rate data to find which wares are consumed when
         producing the target ware, and which wares consume it.
 
-        Returns dict with 'inputs' and 'consumers' lists.
+        Returns dict with 'inputs' and 'consumers' lists (cached, do not mutate).
         """
         target_stats = self.get_ware_stats(ware_id)
         if not target_stats:
             return {"inputs": [], "consumers": []}
 
-        input_stats = []
-        consumer_stats = []
+        cached = self._dependencies.get(target_stats.ware)
+        if cached is not None:
+            return cached
 
-        # Find consumers - wares whose production consumes this ware
-        # by checking which wares are consumed at stations that produce them
-        for stats in self._production_stats.values():
-            if stats.ware.ware_id == target_stats.ware.ware_id:
-                continue
+        if self._produced_at_station is None or self._consumed_at_station is None:
+            self._build_station_index()
 
-            # Check if any station that produces this ware also consumes our target
-            for station_name in stats.station_production_rates.keys():
-                if target_stats.get_station_consumption_rate(station_name) > 0:
-                    if stats not in consumer_stats:
-                        consumer_stats.append(stats)
-                    break
+        # Inputs - wares consumed at stations that produce the target ware
+        inputs: Dict[Ware, ProductionStats] = {}
+        for station_name in target_stats.station_production_rates:
+            for stats in self._consumed_at_station.get(station_name, ()):
+                inputs.setdefault(stats.ware, stats)
 
-            # Check if our target is consumed at stations that produce the target ware
-            if target_stats.get_station_consumption_rate(station_name) > 0:
-                for producing_station in target_stats.station_production_rates.keys():
-                    cons_rate = stats.get_station_consumption_rate(producing_station)
-                    if cons_rate > 0 and stats not in input_stats:
-                        input_stats.append(stats)
+        # Consumers - wares produced at stations that consume the target ware
+        consumers: Dict[Ware, ProductionStats] = {}
+        for station_name, cons_rate in target_stats.station_consumption_rates.items():
+            if cons_rate > 0:
+                for stats in self._produced_at_station.get(station_name, ()):
+                    consumers.setdefault(stats.ware, stats)
 
-        return {
-            "inputs": input_stats,
-            "consumers": consumer_stats
+        inputs.pop(target_stats.ware, None)
+        consumers.pop(target_stats.ware, None)
+
+        dependencies = {
+            "inputs": list(inputs.values()),
+            "consumers": list(consumers.values())
         }
+        self._dependencies[target_stats.ware] = dependencies
+        return dependencies
 
     def get_logistics_summary(self) -> Dict[str, int]:
         """Get empire-wide logistics summary."""
-        assigned_traders = 0
-        assigned_miners = 0
-        assigned_cargo = 0
-        assigned_ships = 0
+        # Station-assigned totals are gathered once by _analyze
+        logistics = self._station_logistics
+        assigned_traders = logistics["traders"]
+        assigned_miners = logistics["miners"]
+        assigned_cargo = logistics["cargo"]
+        assigned_ships = logistics["ships"]
 
         # Calculate trader cargo specifically (excluding miners)
-        trader_cargo = 0
-
-        for station in self.empire.stations:
-            assigned_traders += len(station.traders)
-            assigned_miners += len(station.miners)
-            assigned_cargo += station.total_cargo_capacity
-            assigned_ships += len(station.assigned_ships)
-            trader_cargo += sum(s.cargo_capacity for s in station.traders)
+        trader_cargo = logistics["trader_cargo"]
 
         # Unassigned ships
-        unassigned_ships = len(self.empire.unassigned_ships)
-        unassigned_traders = len(self.empire.unassigned_traders)
-        unassigned_miners = len(self.empire.unassigned_miners)
-        unassigned_cargo = sum(s.cargo_capacity for s in self.empire.unassigned_ships)
-        unassigned_trader_cargo = sum(s.cargo_capacity for s in self.empire.unassigned_traders)
+        unassigned = self._tally_ships(self.empire.unassigned_ships, self._new_ship_totals())
+        unassigned_ships = unassigned["ships"]
+        unassigned_traders = unassigned["traders"]
+        unassigned_miners = unassigned["miners"]
+        unassigned_cargo = unassigned["cargo"]
+        unassigned_trader_cargo = unassigned["trader_cargo"]
 
         return {
             "total_ships": assigned_ships + unassigned_ships,
@@ -519,29 +736,27 @@ class ProductionAnalyzer:
 
     def search_production(self, query: str) -> List[ProductionStats]:
         """Search for production by ware name."""
-        query_lower = query.lower()
-        results = []
+        if self._search_entries is None:
+            self._search_entries = [
+                (stats.ware.name.lower(), stats.ware.ware_id_lower, stats)
+                for stats in self._production_stats.values()
+            ]
 
-        for stats in self._production_stats.values():
-            if query_lower in stats.ware.name.lower() or query_lower in stats.ware.ware_id.lower():
-                results.append(stats)
+        query_lower = query.lower()
+        results = [
+            stats for name_lower, id_lower, stats in self._search_entries
+            if query_lower in name_lower or query_lower in id_lower
+        ]
 
-        return sorted(results, key=lambda s: s.module_count, reverse=True)
+        return sorted(results, key=attrgetter("module_count"), reverse=True)
 
     def get_ship_building_stations(self) -> List[Station]:
-        """Get wharfs, shipyards, and equipment docks."""
-        ship_builders = []
-        for station in self.empire.stations:
-            if station.station_type in ("wharf", "shipyard", "equipmentdock"):
-                ship_builders.append(station)
-        return ship_builders
+        """Get wharfs, shipyards, and equipment docks (cached, do not mutate)."""
+        return self._ship_builders
 
     def get_stations_by_type(self) -> Dict[str, List[Station]]:
-        """Group stations by type."""
-        by_type = defaultdict(list)
-        for station in self.empire.stations:
-            by_type[station.station_type].append(station)
-        return dict(by_type)
+        """Group stations by type (cached, do not mutate)."""
+        return self._stations_by_type
 
     def load_game_data(self, wares_extractor) -> bool:
         """
@@ -568,9 +783,8 @@ class ProductionAnalyzer:
             # This single pass handles both production output and input consumption
             self._calculate_all_consumption_rates(game_wares)
 
-            # Count how many wares got rate data
-            loaded_count = sum(1 for stats in self._production_stats.values() if stats.has_rate_data)
-            return loaded_count > 0
+            # Check whether any wares got rate data
+            return self._rate_data_count > 0
 
         except (AttributeError, KeyError, TypeError) as e:
             logger.warning(f"Failed to load game data: {e}")
@@ -585,88 +799,115 @@ class ProductionAnalyzer:
         - Look up its input requirements from game data
         - Track both empire-wide totals and per-station breakdowns
         """
-        # Track rates per ware and per station
-        # Structure: ware_id -> {total, stations: {station_name -> rate}}
-        production_rates: Dict[str, Dict] = {}  # ware produced
-        consumption_rates: Dict[str, Dict] = {}  # ware consumed
+        # Track rates per ware and per station; empire-wide totals are summed
+        # from the per-station breakdown once accumulation is done
+        # Structure: ware_id -> {station_name -> rate}
+        production_rates: Dict[str, Dict[str, float]] = {}  # ware produced
+        consumption_rates: Dict[str, Dict[str, float]] = {}  # ware consumed
+
+        # Recipes resolved once per tracked ware rather than once per module,
+        # keeping only wares the game data can actually produce:
+        # ware_id -> (output units/hr, [(input ware_id, input units/hr), ...])
+        # Every module output ware was registered by _analyze, so this covers them all.
+        recipes: Dict[str, Tuple[float, List[Tuple[str, float]]]] = {}
+        for ware in self._production_stats:
+            recipe = self._resolve_recipe(game_wares, ware.ware_id_lower)
+            if recipe is not None:
+                recipes[ware.ware_id_lower] = recipe
 
         # Iterate through all production modules in the empire
         for station in self.empire.stations:
+            # Modules making the same ware run at the same rate, so count them
+            # per ware and apply rate * count once per station
+            module_counts: Dict[str, int] = {}
             for module in station.production_modules:
-                if not module.output_ware:
-                    continue
-
-                # Get production data for what this module produces
-                produced_ware_id = module.output_ware.ware_id.lower()
-                game_ware = game_wares.get(produced_ware_id)
-
-                if not game_ware or not game_ware.default_method:
+                output_ware = module.output_ware
+                if output_ware:
+                    ware_id = output_ware.ware_id_lower
+                    module_counts[ware_id] = module_counts.get(ware_id, 0) + 1
+
+            station_name = station.name
+            for produced_ware_id, module_count in module_counts.items():
+                # Get production data for what these modules produce
+                recipe = recipes.get(produced_ware_id)
+                if recipe is None:
                     continue
 
                 # Track production rate for output ware
-                output_rate = game_ware.default_method.units_per_hour
-                if produced_ware_id not in production_rates:
-                    production_rates[produced_ware_id] = {"total": 0.0, "stations": {}}
-                production_rates[produced_ware_id]["total"] += output_rate
-                if station.name not in production_rates[produced_ware_id]["stations"]:
-                    production_rates[produced_ware_id]["stations"][station.name] = 0.0
-                production_rates[produced_ware_id]["stations"][station.name] += output_rate
+                module_output_rate, inputs = recipe
+                output_rate = module_output_rate * module_count
+                station_rates = production_rates.setdefault(produced_ware_id, {})
+                station_rates[station_name] = station_rates.get(station_name, 0.0) + output_rate
 
                 # Track consumption rate for each input ware
-                for resource in game_ware.default_method.resources:
-                    input_ware_id = resource.ware_id.lower()
-                    consumption_rate = game_ware.default_method.resource_per_hour(resource.ware_id)
-
-                    if input_ware_id not in consumption_rates:
-                        consumption_rates[input_ware_id] = {"total": 0.0, "stations": {}}
-                    consumption_rates[input_ware_id]["total"] += consumption_rate
-                    if station.name not in consumption_rates[input_ware_id]["stations"]:
-                        consumption_rates[input_ware_id]["stations"][station.name] = 0.0
-                    consumption_rates[input_ware_id]["stations"][station.name] += consumption_rate
+                for input_ware_id, module_consumption_rate in inputs:
+                    consumption_rate = module_consumption_rate * module_count
+                    station_rates = consumption_rates.setdefault(input_ware_id, {})
+                    station_rates[station_name] = station_rates.get(station_name, 0.0) + consumption_rate
 
         # Apply rates to existing production stats
         # Mark all stats as having rate data - if a ware has no production or consumption
         # rates calculated, that means it's truly "No Demand" (not producing, not consuming)
         for stats in self._production_stats.values():
-            ware_id = stats.ware.ware_id.lower()
+            ware_id = stats.ware.ware_id_lower
 
             # Apply production rates
-            if ware_id in production_rates:
-                stats.production_rate_per_hour = production_rates[ware_id]["total"]
-                stats.station_production_rates = production_rates[ware_id]["stations"]
+            rates = production_rates.get(ware_id)
+            if rates is not None:
+                stats.production_rate_per_hour = sum(rates.values())
+                stats.station_production_rates = rates
 
             # Apply consumption rates
-            if ware_id in consumption_rates:
-                stats.consumption_rate_per_hour = consumption_rates[ware_id]["total"]
-                stats.station_consumption_rates = consumption_rates[ware_id]["stations"]
+            rates = consumption_rates.get(ware_id)
+            if rates is not None:
+                stats.consumption_rate_per_hour = sum(rates.values())
+                stats.station_consumption_rates = rates
 
             # Mark as having rate data - even if rates are 0, we know it's accurate
             # (as opposed to falling back to storage-based estimates)
-            stats.has_rate_data = True
+            if not stats.has_rate_data:
+                stats.has_rate_data = True
+                self._rate_data_count += 1
+            stats._invalidate_status()
 
         # Create stats for wares that are consumed but not produced
         # (e.g., raw materials we buy from NPCs)
         for ware_id, rates in consumption_rates.items():
-            # Check if we already have stats for this ware
-            found = False
-            for stats in self._production_stats.values():
-                if stats.ware.ware_id.lower() == ware_id:
-                    found = True
-                    break
-
-            if not found:
+            # Check if we already have stats for this ware (the index is
+            # updated by _register_stats, so new entries are seen too)
+            if ware_id not in self._by_ware_id_lower:
                 # Create new stats for consumed-only ware
                 ware = get_ware(ware_id)
                 new_stats = ProductionStats(ware)
-                new_stats.consumption_rate_per_hour = rates["total"]
-                new_stats.station_consumption_rates = rates["stations"]
+                new_stats.consumption_rate_per_hour = sum(rates.values())
+                new_stats.station_consumption_rates = rates
                 new_stats.has_rate_data = True
-                self._production_stats[ware] = new_stats
+                self._register_stats(new_stats)
+                self._rate_data_count += 1
+
+        # Per-station rates changed, so the station index must be rebuilt
+        self._invalidate_views()
+
+    @staticmethod
+    def _resolve_recipe(
+        game_wares: dict, ware_id: str
+    ) -> Optional[Tuple[float, List[Tuple[str, float]]]]:
+        """Get a ware's output rate and per-input consumption rates from game data."""
+        game_ware = game_wares.get(ware_id)
+        method = game_ware.default_method if game_ware else None
+        if not method:
+            return None
+        resource_per_hour = method.resource_per_hour
+        inputs = [
+            (resource.ware_id.lower(), resource_per_hour(resource.ware_id))
+            for resource in method.resources
+        ]
+        return method.units_per_hour, inputs
 
     @property
     def has_rate_data(self) -> bool:
         """Check if any production stats have rate data loaded."""
-        return any(stats.has_rate_data for stats in self._production_stats.values())
+        return self._rate_data_count > 0
 
     def get_station_rates(self, station_name: str) -> Dict[str, Dict[str, float]]:
         """
@@ -698,13 +939,15 @@ class ProductionAnalyzer:
         Get a comprehensive rate summary for a station.
 
         Returns dict with:
-        - produced_wares: List of {ware, rate, modules} for each produced ware
-        - consumed_wares: List of {ware, rate} for each consumed ware
-        - net_rates: List of {ware, net_rate} where net_rate = production - consumption
+        - produced_wares: StationWareRate (with module count) for each produced ware
+        - consumed_wares: StationWareRate for each consumed ware
+        - net_rates: StationNetRate for each ware, where net_rate = production - consumption
         """
-        produced: List[Dict[str, Any]] = []
-        consumed: List[Dict[str, Any]] = []
-        net_rates: Dict[str, Dict[str, float]] = {}
+        produced: Dict[str, StationWareRate] = {}
+        consumed: List[StationWareRate] = []
+        # Per-ware rates at this station, for the net rate list
+        produced_rates: Dict[str, float] = {}
+        consumed_rates: Dict[str, float] = {}
 
         # Get production from this station's modules
         for module in station.production_modules:
@@ -715,52 +958,38 @@ class ProductionAnalyzer:
             stats = self._production_stats.get(module.output_ware)
             if stats and stats.has_rate_data:
                 rate = stats.get_station_production_rate(station.name)
-                # Find existing entry or create new
-                existing = next((p for p in produced if p["ware"] == ware_name), None)
+                existing = produced.get(ware_name)
                 if existing:
-                    existing["modules"] += 1
+                    existing.modules += 1
                 else:
-                    produced.append({
-                        "ware": ware_name,
-                        "ware_id": module.output_ware.ware_id,
-                        "rate": rate,
-                        "modules": 1
-                    })
+                    produced[ware_name] = StationWareRate(
+                        ware_name, module.output_ware.ware_id, rate, modules=1
+                    )
 
                 # Track net rate
-                if ware_name not in net_rates:
-                    net_rates[ware_name] = {"produced": 0, "consumed": 0}
-                net_rates[ware_name]["produced"] = rate
+                produced_rates[ware_name] = rate
 
         # Get consumption at this station
         for stats in self._production_stats.values():
             cons_rate = stats.get_station_consumption_rate(station.name)
             if cons_rate > 0:
-                consumed.append({
-                    "ware": stats.ware.name,
-                    "ware_id": stats.ware.ware_id,
-                    "rate": cons_rate
-                })
+                consumed.append(StationWareRate(stats.ware.name, stats.ware.ware_id, cons_rate))
 
                 # Track net rate
-                if stats.ware.name not in net_rates:
-                    net_rates[stats.ware.name] = {"produced": 0, "consumed": 0}
-                net_rates[stats.ware.name]["consumed"] = cons_rate
+                consumed_rates[stats.ware.name] = cons_rate
 
-        # Calculate net rates
+        # Calculate net rates (produced wares first, then consumed-only ones)
+        ware_names = list(produced_rates)
+        ware_names.extend(w for w in consumed_rates if w not in produced_rates)
         net_list = []
-        for ware_name, rates in net_rates.items():
-            net = rates["produced"] - rates["consumed"]
-            net_list.append({
-                "ware": ware_name,
-                "net_rate": net,
-                "production": rates["produced"],
-                "consumption": rates["consumed"]
-            })
+        for ware_name in ware_names:
+            production = produced_rates.get(ware_name, 0)
+            consumption = consumed_rates.get(ware_name, 0)
+            net_list.append(StationNetRate(ware_name, production - consumption, production, consumption))
 
         return {
-            "produced_wares": sorted(produced, key=lambda x: x["rate"], reverse=True),
-            "consumed_wares": sorted(consumed, key=lambda x: x["rate"], reverse=True),
-            "net_rates": sorted(net_list, key=lambda x: x["net_rate"])
+            "produced_wares": sorted(produced.values(), key=attrgetter("rate"), reverse=True),
+            "consumed_wares": sorted(consumed, key=attrgetter("rate"), reverse=True),
+            "net_rates": sorted(net_list, key=attrgetter("net_rate"))
         }
 
@@ -1,10 +1,11 @@
 """Compare two save files to identify changes in supply status and production."""
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List
 from enum import Enum
 
-from ..models.entities import Ware
+from ..models.entities import DATACLASS_SLOTS, Ware
+from ..models.ware_database import get_ware
 
 
 class ChangeType(Enum):
@@ -16,7 +17,25 @@ class ChangeType(Enum):
     UNCHANGED = "unchanged"    # Same status
 
 
-@dataclass
+# Status ranking for comparison (higher = better)
+STATUS_RANK = {
+    "Surplus": 3,
+    "Balanced": 2,
+    "No Demand": 1,  # Neutral - no consumption
+    "Shortage": 0,
+    "Not Produced": -1
+}
+
+# Order in which changes are listed, most significant first (unchanged are not listed)
+CHANGE_DISPLAY_ORDER = (
+    ChangeType.DEGRADED,
+    ChangeType.STOPPED,
+    ChangeType.IMPROVED,
+    ChangeType.NEW_PRODUCTION,
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class WareChange:
     """Change in a single ware between two saves."""
     ware: Ware
@@ -43,7 +62,7 @@ class WareChange:
     balance_delta: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StationChange:
     """Change in stations between saves."""
     name: str
@@ -53,7 +72,7 @@ class StationChange:
     module_delta: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SaveComparison:
     """Complete comparison between two saves."""
     old_save_timestamp: str
@@ -111,61 +130,65 @@ def compare_empires(old_analyzer, new_analyzer,
     new_stats_map = {s.ware.ware_id: s for s in new_analyzer.get_all_production_stats()}
 
     # All ware IDs from both saves
-    all_ware_ids = set(old_stats_map.keys()) | set(new_stats_map.keys())
+    all_ware_ids = old_stats_map.keys() | new_stats_map.keys()
     comparison.total_wares_compared = len(all_ware_ids)
 
+    # Bucket changes by type; listing the buckets in display order sorts them
+    by_type: Dict[ChangeType, List[WareChange]] = {change_type: [] for change_type in ChangeType}
+    unchanged_count = 0
     for ware_id in all_ware_ids:
         old_stats = old_stats_map.get(ware_id)
         new_stats = new_stats_map.get(ware_id)
 
+        # Tracked in both saves with the same status is always unchanged, and
+        # unchanged wares aren't listed, so skip building a WareChange for them
+        if old_stats and new_stats and old_stats.supply_status == new_stats.supply_status:
+            unchanged_count += 1
+            continue
+
         change = _compare_ware_stats(ware_id, old_stats, new_stats)
+        by_type[change.change_type].append(change)
+
+    # Count by type
+    comparison.improved_count = len(by_type[ChangeType.IMPROVED])
+    comparison.degraded_count = len(by_type[ChangeType.DEGRADED])
+    comparison.new_production_count = len(by_type[ChangeType.NEW_PRODUCTION])
+    comparison.stopped_count = len(by_type[ChangeType.STOPPED])
+    comparison.unchanged_count = unchanged_count + len(by_type[ChangeType.UNCHANGED])
 
-        # Count by type
-        if change.change_type == ChangeType.IMPROVED:
-            comparison.improved_count += 1
-            comparison.ware_changes.append(change)
-        elif change.change_type == ChangeType.DEGRADED:
-            comparison.degraded_count += 1
-            comparison.ware_changes.append(change)
-        elif change.change_type == ChangeType.NEW_PRODUCTION:
-            comparison.new_production_count += 1
-            comparison.ware_changes.append(change)
-        elif change.change_type == ChangeType.STOPPED:
-            comparison.stopped_count += 1
-            comparison.ware_changes.append(change)
-        else:
-            comparison.unchanged_count += 1
-            # Don't add unchanged to the list
+    # Changes sorted by significance (don't add unchanged to the list)
+    for change_type in CHANGE_DISPLAY_ORDER:
+        comparison.ware_changes.extend(by_type[change_type])
 
     # Compare stations
     old_stations = {s.name: s for s in old_analyzer.empire.stations}
     new_stations = {s.name: s for s in new_analyzer.empire.stations}
 
-    all_station_names = set(old_stations.keys()) | set(new_stations.keys())
+    all_station_names = old_stations.keys() | new_stations.keys()
 
     for name in all_station_names:
         old_station = old_stations.get(name)
         new_station = new_stations.get(name)
+        old_count = old_station.module_count if old_station else 0
+        new_count = new_station.module_count if new_station else 0
 
         if old_station and not new_station:
             comparison.stations_removed += 1
-            comparison.total_modules_delta -= len(old_station.production_modules)
+            comparison.total_modules_delta -= old_count
             comparison.station_changes.append(StationChange(
                 name=name,
                 change_type="removed",
-                old_module_count=len(old_station.production_modules)
+                old_module_count=old_count
             ))
         elif new_station and not old_station:
             comparison.stations_added += 1
-            comparison.total_modules_delta += len(new_station.production_modules)
+            comparison.total_modules_delta += new_count
             comparison.station_changes.append(StationChange(
                 name=name,
                 change_type="added",
-                new_module_count=len(new_station.production_modules)
+                new_module_count=new_count
             ))
         elif old_station and new_station:
-            old_count = len(old_station.production_modules)
-            new_count = len(new_station.production_modules)
             delta = new_count - old_count
             if delta != 0:
                 comparison.total_modules_delta += delta
@@ -180,21 +203,11 @@ def compare_empires(old_analyzer, new_analyzer,
     # Generate alerts for significant changes
     comparison.alerts = _generate_alerts(comparison)
 
-    # Sort changes by significance
-    comparison.ware_changes.sort(key=lambda c: (
-        0 if c.change_type == ChangeType.DEGRADED else
-        1 if c.change_type == ChangeType.STOPPED else
-        2 if c.change_type == ChangeType.IMPROVED else
-        3 if c.change_type == ChangeType.NEW_PRODUCTION else 4
-    ))
-
     return comparison
 
 
 def _compare_ware_stats(ware_id: str, old_stats, new_stats) -> WareChange:
     """Compare stats for a single ware."""
-    from ..models.ware_database import get_ware
-
     ware = get_ware(ware_id)
 
     # Handle missing stats
@@ -261,17 +274,9 @@ def _determine_change_type(old_status: str, new_status: str,
     if old_status == new_status:
         return ChangeType.UNCHANGED
 
-    # Status ranking for comparison (higher = better)
-    status_rank = {
-        "Surplus": 3,
-        "Balanced": 2,
-        "No Demand": 1,  # Neutral - no consumption
-        "Shortage": 0,
-        "Not Produced": -1
-    }
-
-    old_rank = status_rank.get(old_status, 1)
-    new_rank = status_rank.get(new_status, 1)
+    rank = STATUS_RANK.get
+    old_rank = rank(old_status, 1)
+    new_rank = rank(new_status, 1)
 
     if new_rank > old_rank:
         return ChangeType.IMPROVED
@@ -285,19 +290,19 @@ def _generate_alerts(comparison: SaveComparison) -> List[str]:
     """Generate alert messages for significant changes."""
     alerts = []
 
-    # New shortages are critical
-    new_shortages = [c for c in comparison.ware_changes
-                     if c.change_type == ChangeType.DEGRADED
-                     and c.new_status == "Shortage"]
-    if new_shortages:
-        alerts.append(f"⚠️  {len(new_shortages)} ware(s) now in SHORTAGE")
+    # New shortages are critical; resolved shortages are good news
+    new_shortages = 0
+    resolved = 0
+    for c in comparison.ware_changes:
+        if c.change_type is ChangeType.DEGRADED and c.new_status == "Shortage":
+            new_shortages += 1
+        elif c.change_type is ChangeType.IMPROVED and c.old_status == "Shortage":
+            resolved += 1
 
-    # Resolved shortages are good news
-    resolved = [c for c in comparison.ware_changes
-                if c.change_type == ChangeType.IMPROVED
-                and c.old_status == "Shortage"]
+    if new_shortages:
+        alerts.append(f"⚠️  {new_shortages} ware(s) now in SHORTAGE")
     if resolved:
-        alerts.append(f"✓ {len(resolved)} shortage(s) resolved")
+        alerts.append(f"✓ {resolved} shortage(s) resolved")
 
     # Stations removed
     if comparison.stations_removed > 0:
@@ -4,13 +4,20 @@ import sys
 from typing import Optional
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
-from .parsers.streaming_parser import StreamingParser
-from .analyzers.production_analyzer import ProductionAnalyzer
-from .ui.dashboard import Dashboard
-from .ui.views import ViewRenderer
 from .config import ConfigManager
 
+# Pre-built Text so Rich prints it as-is, without markup parsing or highlighting
+BANNER = Text("""╔═══════════════════════════════════════════════════════╗
+║                                                       ║
+║     X4 EMPIRE PRODUCTION ANALYZER v1.0                ║
+║                                                       ║
+║     Analyze your production empire and optimize       ║
+║     resource management in X4: Foundations            ║
+║                                                       ║
+╚═══════════════════════════════════════════════════════╝""", style="bold cyan")
+
 
 class X4Analyzer:
     """Main application class."""
@@ -36,6 +43,13 @@ class X4Analyzer:
             self.console.print("[red]No file specified[/red]")
             return False
 
+        # Imported here so the banner and save selection don't wait on lxml
+        # and the analysis/UI modules
+        from .parsers.streaming_parser import StreamingParser
+        from .analyzers.production_analyzer import ProductionAnalyzer
+        from .ui.dashboard import Dashboard
+        from .ui.views import ViewRenderer
+
         try:
             # Load game data first (needed for ship cargo capacity during parsing)
             self._load_game_data_for_parsing()
@@ -248,15 +262,7 @@ class X4Analyzer:
 
     def _show_banner(self):
         """Show application banner."""
-        banner = """╔═══════════════════════════════════════════════════════╗
-║                                                       ║
-║     X4 EMPIRE PRODUCTION ANALYZER v1.0                ║
-║                                                       ║
-║     Analyze your production empire and optimize       ║
-║     resource management in X4: Foundations            ║
-║                                                       ║
-╚═══════════════════════════════════════════════════════╝"""
-        self.console.print(banner, style="bold cyan")
+        self.console.print(BANNER)
         self.console.print()
 
 
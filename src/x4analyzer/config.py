@@ -1,13 +1,19 @@
 """Configuration management for X4 Analyzer."""
 
+import heapq
 import json
 import logging
+import os
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 logger = logging.getLogger("x4analyzer.config")
 
+# Save file names: save_001.xml.gz, quicksave.xml.gz (or uncompressed .xml)
+SAVE_FILE_PREFIXES = ("save_", "quicksave")
+SAVE_FILE_SUFFIXES = (".xml.gz", ".xml")
+
 
 @dataclass
 class X4Config:
@@ -107,11 +113,7 @@ class PathDetector:
         for path in cls.SAVE_PATHS:
             if path.exists() and path.is_dir():
                 # Check if it contains save files (gzipped or plain XML)
-                save_files = (list(path.glob("save_*.xml.gz")) +
-                              list(path.glob("quicksave*.xml.gz")) +
-                              list(path.glob("save_*.xml")) +
-                              list(path.glob("quicksave*.xml")))
-                if save_files:
+                if cls._has_save_files(path):
                     logger.info(f"Found save directory: {path}")
                     return path
 
@@ -124,17 +126,22 @@ class PathDetector:
                     if subdir.is_dir():
                         save_path = subdir / "save"
                         if save_path.exists() and save_path.is_dir():
-                            save_files = (list(save_path.glob("save_*.xml.gz")) +
-                                          list(save_path.glob("quicksave*.xml.gz")) +
-                                          list(save_path.glob("save_*.xml")) +
-                                          list(save_path.glob("quicksave*.xml")))
-                            if save_files:
+                            if cls._has_save_files(save_path):
                                 logger.info(f"Found save directory: {save_path}")
                                 return save_path
 
         logger.warning("Could not auto-detect save directory")
         return None
 
+    @classmethod
+    def _has_save_files(cls, path: Path) -> bool:
+        """Check whether a directory holds at least one save file."""
+        with os.scandir(path) as it:
+            return any(
+                entry.name.startswith(SAVE_FILE_PREFIXES) and entry.name.endswith(SAVE_FILE_SUFFIXES)
+                for entry in it
+            )
+
     @classmethod
     def find_game_directory(cls) -> Optional[Path]:
         """Find the X4 game installation directory."""
@@ -151,47 +158,39 @@ class PathDetector:
     @classmethod
     def _verify_game_directory(cls, path: Path) -> bool:
         """Verify that a directory is a valid X4 installation."""
-        # Check for key files that should exist in X4 installation
-        expected_files = [
-            path / "01.cat",  # Main game data catalog
-            path / "X4.exe",  # Windows executable
-        ]
-        expected_files_linux = [
-            path / "01.cat",
-            path / "X4",  # Linux executable
-        ]
-
-        # Check Windows paths
-        if all(f.exists() for f in expected_files):
-            return True
-
-        # Check Linux paths
-        if all(f.exists() for f in expected_files_linux):
-            return True
-
-        # At minimum, check for catalog files
-        cat_files = list(path.glob("*.cat"))
-        return len(cat_files) > 0
+        # The main game data catalog is present on every install; any other
+        # catalog is accepted as a fallback (stop at the first one found)
+        return (path / "01.cat").is_file() or any(path.glob("*.cat"))
 
     @classmethod
-    def find_recent_saves(cls, save_dir: Path, limit: int = 10) -> List[Path]:
-        """Find the most recent save files in a directory."""
+    def _scan_recent_saves(cls, save_dir: Path, limit: int) -> List[Tuple[Path, os.stat_result]]:
+        """Find the most recent save files with their stat results, in one directory scan."""
         if not save_dir or not save_dir.exists():
             return []
 
-        save_files = list(save_dir.glob("save_*.xml.gz")) + list(save_dir.glob("quicksave*.xml.gz"))
+        with os.scandir(save_dir) as it:
+            saves = (
+                (entry.path, entry.stat()) for entry in it
+                if entry.name.startswith(SAVE_FILE_PREFIXES) and entry.name.endswith(".xml.gz")
+                and entry.is_file()
+            )
+            # Most recently modified first; only the kept entries are sorted
+            recent = heapq.nlargest(limit, saves, key=lambda save: save[1].st_mtime)
 
-        # Sort by modification time, most recent first
-        save_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        return [(Path(path), stat) for path, stat in recent]
 
-        return save_files[:limit]
+    @classmethod
+    def find_recent_saves(cls, save_dir: Path, limit: int = 10) -> List[Path]:
+        """Find the most recent save files in a directory."""
+        return [path for path, _ in cls._scan_recent_saves(save_dir, limit)]
 
     @classmethod
-    def get_save_file_info(cls, save_path: Path) -> dict:
-        """Get information about a save file."""
+    def get_save_file_info(cls, save_path: Path, stat: Optional[os.stat_result] = None) -> dict:
+        """Get information about a save file, reusing its stat result if already known."""
         import time
 
-        stat = save_path.stat()
+        if stat is None:
+            stat = save_path.stat()
         return {
             "name": save_path.name,
             "path": str(save_path),
@@ -251,21 +250,27 @@ class ConfigManager:
         if not save_dir:
             return []
 
-        saves = PathDetector.find_recent_saves(save_dir, limit)
-        return [PathDetector.get_save_file_info(s) for s in saves]
+        saves = PathDetector._scan_recent_saves(save_dir, limit)
+        return [PathDetector.get_save_file_info(path, stat) for path, stat in saves]
 
     def set_save_directory(self, path: str):
         """Manually set the save directory."""
+        if self.config.save_directory == path:
+            return
         self.config.save_directory = path
         self.config.save()
 
     def set_game_directory(self, path: str):
         """Manually set the game directory."""
+        if self.config.game_directory == path:
+            return
         self.config.game_directory = path
         self.config.save()
 
     def set_last_save(self, path: str):
         """Record the last used save file."""
+        if self.config.last_save_file == path:
+            return
         self.config.last_save_file = path
         self.config.save()
 
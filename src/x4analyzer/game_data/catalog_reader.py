@@ -1,12 +1,26 @@
 """Reader for X4 catalog (.cat) and data (.dat) file pairs."""
 
+import gc
+import gzip
 import logging
+import mmap
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 from dataclasses import dataclass
 
+try:
+    # Use ISA-L's faster inflate for gzipped entries when it is installed
+    from isal import igzip as gzip_impl
+except ImportError:
+    gzip_impl = gzip
+
 logger = logging.getLogger("x4analyzer.game_data")
 
+# Compressed bytes read when only the start of a gzipped entry is needed
+PEEK_COMPRESSED_BYTES = 4096
+
 
 @dataclass
 class CatalogEntry:
@@ -34,8 +48,87 @@ class CatalogReader:
         self.game_dir = Path(game_directory)
         self.entries: Dict[str, tuple[CatalogEntry, Path]] = {}  # filename -> (entry, dat_path) - latest version
         self.all_entries: Dict[str, List[tuple[CatalogEntry, Path]]] = {}  # filename -> all versions
+        # Normalized (forward slashes, lowercase) filename -> catalog filenames, in first-seen order
+        self._normalized: Dict[str, List[str]] = {}
+        # .dat path -> read-only memory map, opened on first read (see close())
+        self._dat_maps: Dict[Path, mmap.mmap] = {}
+        # (.dat path, offset) -> decompressed data for gzipped entries (see clear_cache())
+        self._decompressed: Dict[Tuple[Path, int], bytes] = {}
         self._load_catalogs()
 
+    def __enter__(self) -> "CatalogReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Unmap all .dat files and drop cached data. Files are mapped again if needed."""
+        self.clear_cache()
+        # getattr: __del__ may run on a reader whose __init__ failed early
+        dat_maps = getattr(self, "_dat_maps", None)
+        if not dat_maps:
+            return
+        for dat_map in dat_maps.values():
+            dat_map.close()
+        dat_maps.clear()
+
+    def clear_cache(self):
+        """Drop cached decompressed file data."""
+        decompressed = getattr(self, "_decompressed", None)
+        if decompressed:
+            decompressed.clear()
+
+    def _read_entry(self, entry: CatalogEntry, dat_path: Path) -> bytes:
+        """Read an entry's data from its .dat file, decompressing gzip data."""
+        if not entry.size:
+            return b""
+
+        # Several extractors read the same files; decompress each one only once
+        key = (dat_path, entry.offset)
+        data = self._decompressed.get(key)
+        if data is not None:
+            return data
+
+        data = self._dat_map(dat_path)[entry.offset:entry.offset + entry.size]
+
+        # Check if data is compressed (gzip)
+        if data[:2] == b'\x1f\x8b':
+            data = gzip_impl.decompress(data)
+            self._decompressed[key] = data
+
+        return data
+
+    def _peek_entry(self, entry: CatalogEntry, dat_path: Path, length: int) -> bytes:
+        """Read the first bytes of an entry's data, decompressing only as much as needed."""
+        cached = self._decompressed.get((dat_path, entry.offset))
+        if cached is not None:
+            return cached[:length]
+
+        # A few KB of compressed data is plenty for a short header
+        head_size = min(entry.size, PEEK_COMPRESSED_BYTES)
+        data = self._dat_map(dat_path)[entry.offset:entry.offset + head_size]
+        if data[:2] != b'\x1f\x8b':
+            return data[:length]
+
+        head = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(data, length)
+        if len(head) < length and head_size < entry.size:
+            # Not enough decompressed from the partial read; fall back to a full read
+            return self._read_entry(entry, dat_path)[:length]
+        return head
+
+    def _dat_map(self, dat_path: Path) -> mmap.mmap:
+        """Get the memory map for a .dat file, mapping it on first use."""
+        dat_map = self._dat_maps.get(dat_path)
+        if dat_map is None:
+            with open(dat_path, 'rb') as f:
+                dat_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._dat_maps[dat_path] = dat_map
+        return dat_map
+
     def _load_catalogs(self):
         """Load all catalog files in order."""
         # Find all .cat files and sort them
@@ -48,27 +141,44 @@ class CatalogReader:
                 if ext_dir.is_dir():
                     cat_files.extend(sorted(ext_dir.glob("*.cat")))
 
-        for cat_file in cat_files:
-            self._load_catalog(cat_file)
+        # The index holds a few containers per entry (hundreds of thousands in
+        # total); building it with the cyclic GC running spends about half the
+        # load time rescanning objects that can't form cycles
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # Catalogs are read and parsed independently, then merged in sorted
+            # order so later catalogs still override earlier ones
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(cat_files)))) as executor:
+                parsed = list(executor.map(self._read_catalog, cat_files))
+
+            for cat_file, entries in zip(cat_files, parsed):
+                self._add_entries(entries, cat_file.with_suffix(".dat"))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
 
         logger.info(f"Loaded {len(self.entries)} files from {len(cat_files)} catalogs")
 
-    def _load_catalog(self, cat_path: Path):
-        """Load a single catalog file."""
+    def _read_catalog(self, cat_path: Path) -> List[CatalogEntry]:
+        """Read a single catalog file's entries, with offsets into its .dat file."""
         dat_path = cat_path.with_suffix(".dat")
 
         if not dat_path.exists():
             logger.warning(f"Missing .dat file for {cat_path}")
-            return
+            return []
 
         try:
-            with open(cat_path, 'rb') as f:
-                content = f.read()
-
             # Parse catalog entries
             # Format: Each line is "filename size timestamp\n"
             # The offset is implicit (cumulative from start of dat file)
-            entries = self._parse_catalog_content(content)
+            # Lines are read straight from a memory map rather than copying the
+            # whole catalog into memory first (empty files can't be mapped)
+            entries: List[CatalogEntry] = []
+            if cat_path.stat().st_size:
+                with open(cat_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    entries = self._parse_catalog_content(iter(content.readline, b''))
 
             # Track current offset in dat file
             offset = 0
@@ -76,55 +186,62 @@ class CatalogReader:
                 entry.offset = offset
                 offset += entry.size
 
-                # Store entry (later catalogs override earlier ones for default access)
-                self.entries[entry.filename] = (entry, dat_path)
-
-                # Also track all versions for base file lookup
-                if entry.filename not in self.all_entries:
-                    self.all_entries[entry.filename] = []
-                self.all_entries[entry.filename].append((entry, dat_path))
+            return entries
 
         except Exception as e:
             logger.error(f"Failed to load catalog {cat_path}: {e}")
-
-    def _parse_catalog_content(self, content: bytes) -> List[CatalogEntry]:
-        """Parse catalog content into entries."""
+            return []
+
+    def _add_entries(self, entries: List[CatalogEntry], dat_path: Path):
+        """Index a catalog's entries; call in catalog order."""
+        for entry in entries:
+            # Store entry (later catalogs override earlier ones for default access)
+            self.entries[entry.filename] = (entry, dat_path)
+
+            # Also track all versions for base file lookup
+            if entry.filename not in self.all_entries:
+                self.all_entries[entry.filename] = []
+                self._normalized.setdefault(self._normalize(entry.filename), []).append(entry.filename)
+            self.all_entries[entry.filename].append((entry, dat_path))
+
+    def _parse_catalog_content(self, lines: Iterable[bytes]) -> List[CatalogEntry]:
+        """Parse catalog lines into entries."""
         entries = []
 
         try:
             # Catalogs are text files with entries like:
             # filename size timestamp hash
-            # Note: filename can contain spaces, so we parse from the end
-            text = content.decode('utf-8', errors='replace')
-
-            for line in text.strip().split('\n'):
-                if not line.strip():
-                    continue
-
+            # Note: filename can contain spaces, so we parse from the end.
+            # Lines are parsed as bytes; only the filename needs decoding.
+            for line in lines:
                 # Parse from the end: hash timestamp size filename
                 # This handles filenames with spaces correctly
-                parts = line.strip().rsplit(' ', 3)
+                parts = line.strip().rsplit(b' ', 3)
                 if len(parts) == 4:
-                    filename = parts[0]
                     try:
                         size = int(parts[1])
                         timestamp = int(parts[2])
                         # parts[3] is the hash, which we don't need
-
-                        entries.append(CatalogEntry(
-                            filename=filename,
-                            offset=0,  # Will be set later
-                            size=size,
-                            timestamp=timestamp
-                        ))
                     except ValueError:
                         # Skip malformed lines
                         continue
+
+                    entries.append(CatalogEntry(
+                        filename=parts[0].decode('utf-8', errors='replace'),
+                        offset=0,  # Will be set later
+                        size=size,
+                        timestamp=timestamp
+                    ))
         except Exception as e:
             logger.error(f"Failed to parse catalog content: {e}")
 
         return entries
 
+    @staticmethod
+    def _normalize(filename: str) -> str:
+        """Normalize path separators and case for filename lookups."""
+        return filename.replace('\\', '/').lower()
+
     def list_files(self, pattern: Optional[str] = None) -> List[str]:
         """List all files in the catalogs, optionally filtered by pattern."""
         files = list(self.entries.keys())
@@ -137,25 +254,13 @@ class CatalogReader:
 
     def file_exists(self, filename: str) -> bool:
         """Check if a file exists in the catalogs."""
-        # Normalize path separators
-        normalized = filename.replace('\\', '/').lower()
-
-        for entry_name in self.entries.keys():
-            if entry_name.replace('\\', '/').lower() == normalized:
-                return True
-        return False
+        return self._normalize(filename) in self._normalized
 
     def read_file(self, filename: str) -> Optional[bytes]:
         """Read a file from the catalogs."""
-        # Normalize path separators
-        normalized = filename.replace('\\', '/').lower()
-
-        # Find matching entry
-        entry_info = None
-        for entry_name, info in self.entries.items():
-            if entry_name.replace('\\', '/').lower() == normalized:
-                entry_info = info
-                break
+        # Find matching entry (the first catalog filename seen with this normalized name)
+        names = self._normalized.get(self._normalize(filename))
+        entry_info = self.entries[names[0]] if names else None
 
         if not entry_info:
             logger.warning(f"File not found in catalogs: {filename}")
@@ -164,16 +269,7 @@ class CatalogReader:
         entry, dat_path = entry_info
 
         try:
-            with open(dat_path, 'rb') as f:
-                f.seek(entry.offset)
-                data = f.read(entry.size)
-
-            # Check if data is compressed (gzip)
-            if data[:2] == b'\x1f\x8b':
-                import gzip
-                data = gzip.decompress(data)
-
-            return data
+            return self._read_entry(entry, dat_path)
 
         except Exception as e:
             logger.error(f"Failed to read {filename} from {dat_path}: {e}")
@@ -196,14 +292,10 @@ class CatalogReader:
         X4 uses a diff system where extensions provide <diff> patches.
         This method tries to find the original base file, not the diff.
         """
-        # Normalize path separators
-        normalized = filename.replace('\\', '/').lower()
-
         # Find ALL matching entries across catalogs
         matching_entries = []
-        for entry_name, versions in self.all_entries.items():
-            if entry_name.replace('\\', '/').lower() == normalized:
-                matching_entries.extend(versions)
+        for entry_name in self._normalized.get(self._normalize(filename), ()):
+            matching_entries.extend(self.all_entries[entry_name])
 
         if not matching_entries:
             logger.warning(f"File not found in catalogs: {filename}")
@@ -214,19 +306,12 @@ class CatalogReader:
 
         for entry, dat_path in matching_entries:
             try:
-                with open(dat_path, 'rb') as f:
-                    f.seek(entry.offset)
-                    data = f.read(entry.size)
-
-                # Check if data is compressed (gzip)
-                if data[:2] == b'\x1f\x8b':
-                    import gzip
-                    data = gzip.decompress(data)
-
-                # Check if this is a diff file (for XML files)
-                if data[:100].find(b'<diff>') == -1 and data[:100].find(b'<diff ') == -1:
+                # Check if this is a diff file (for XML files) from the start of
+                # the data, so diffs are never read or decompressed in full
+                head = self._peek_entry(entry, dat_path, 100)
+                if head.find(b'<diff>') == -1 and head.find(b'<diff ') == -1:
                     # Not a diff file, return it
-                    return data
+                    return self._read_entry(entry, dat_path)
 
                 logger.debug(f"Skipping diff file from {dat_path} for {filename}")
 
@@ -238,13 +323,7 @@ class CatalogReader:
         logger.warning(f"No non-diff version found for {filename}, returning largest version")
         entry, dat_path = matching_entries[0]
         try:
-            with open(dat_path, 'rb') as f:
-                f.seek(entry.offset)
-                data = f.read(entry.size)
-            if data[:2] == b'\x1f\x8b':
-                import gzip
-                data = gzip.decompress(data)
-            return data
+            return self._read_entry(entry, dat_path)
         except Exception as e:
             logger.error(f"Failed to read {filename}: {e}")
             return None
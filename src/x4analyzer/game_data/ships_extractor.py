@@ -149,13 +149,12 @@ class ShipsExtractor:
         logger.info("Extracting ship data from game files...")
 
         try:
-            catalog = CatalogReader(self.game_dir)
+            with CatalogReader(self.game_dir) as catalog:
+                # First, extract all storage macros to get cargo capacities
+                self._extract_storage_macros(catalog)
 
-            # First, extract all storage macros to get cargo capacities
-            self._extract_storage_macros(catalog)
-
-            # Then extract ship macros
-            self._extract_ship_macros(catalog)
+                # Then extract ship macros
+                self._extract_ship_macros(catalog)
 
             self._loaded = True
             self._save_to_cache()
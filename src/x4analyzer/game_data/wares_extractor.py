@@ -49,6 +49,8 @@ class ProductionMethod:
     time_seconds: float  # Production cycle time in seconds
     amount_produced: int  # Amount produced per cycle
     resources: List[ResourceRequirement] = field(default_factory=list)
+    # ware_id -> units/hour, built on first resource_per_hour() call
+    _rph_cache: Optional[Dict[str, float]] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def units_per_hour(self) -> float:
@@ -60,13 +62,15 @@ class ProductionMethod:
 
     def resource_per_hour(self, ware_id: str) -> float:
         """Calculate consumption rate of a resource in units per hour."""
-        if self.time_seconds <= 0:
-            return 0.0
-        cycles_per_hour = 3600 / self.time_seconds
-        for res in self.resources:
-            if res.ware_id == ware_id:
-                return cycles_per_hour * res.amount
-        return 0.0
+        if self._rph_cache is None:
+            rates: Dict[str, float] = {}
+            if self.time_seconds > 0:
+                cycles_per_hour = 3600 / self.time_seconds
+                for res in self.resources:
+                    # First entry wins if a resource is listed twice
+                    rates.setdefault(res.ware_id, cycles_per_hour * res.amount)
+            self._rph_cache = rates
+        return self._rph_cache.get(ware_id, 0.0)
 
 
 @dataclass
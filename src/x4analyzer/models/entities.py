@@ -1,9 +1,14 @@
 """Data models for X4 game entities."""
 
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Optional
 from enum import Enum
 
+# dataclass(slots=True) needs Python 3.10+; older versions fall back to __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class WareCategory(Enum):
     """Production ware categories based on production tiers."""
@@ -37,23 +42,34 @@ class ShipPurpose(Enum):
         return cls.OTHER
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Ware:
     """Represents a production ware/commodity."""
     ware_id: str
     name: str
     category: WareCategory = WareCategory.UNKNOWN
+    # Lowercase ware_id, computed once for case-insensitive lookups
+    ware_id_lower: str = field(init=False, repr=False, compare=False)
+    # Wares are dict keys throughout the analyzers; hash once
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.ware_id_lower = self.ware_id.lower()
+        self._hash = hash(self.ware_id)
 
     def __hash__(self):
-        return hash(self.ware_id)
+        return self._hash
 
     def __eq__(self, other):
+        # get_ware() hands out shared instances, so identity is the common case
+        if other is self:
+            return True
         if isinstance(other, Ware):
             return self.ware_id == other.ware_id
         return False
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TradeResource:
     """Input or output resource for production."""
     ware: Ware
@@ -68,7 +84,7 @@ class TradeResource:
         return (self.amount / self.capacity) * 100
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProductionModule:
     """Represents a production module on a station."""
     module_id: str
@@ -78,14 +94,14 @@ class ProductionModule:
     # NOTE: Input requirements are looked up from game data (wares.xml) rather than
     # parsed from save files. The game data provides accurate per-cycle consumption
     # which we use in ProductionAnalyzer._calculate_all_consumption_rates().
+    # Whether this is a production module, derived from the macro once
+    is_production: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_production(self) -> bool:
-        """Check if this is a production module."""
-        return "prod_" in self.macro.lower()
+    def __post_init__(self):
+        self.is_production = "prod_" in self.macro.lower()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Ship:
     """Represents a ship assigned to a station."""
     ship_id: str
@@ -99,6 +115,19 @@ class Ship:
     mining_ware: str = ""  # What ware this ship is mining (if any)
     order_type: str = ""  # Current order type: "MiningRoutine", "TradeRoutine", etc.
     race: str = ""  # Manufacturing faction: argon, paranid, teladi, etc.
+    # Which raw materials this ship could mine ("solid" or "liquid"), derived once
+    mining_cargo_type: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        cargo_tags = self.cargo_tags.lower() if self.cargo_tags else ""
+        if "solid" in cargo_tags:
+            self.mining_cargo_type = "solid"
+        elif "liquid" in cargo_tags or "gas" in cargo_tags:
+            self.mining_cargo_type = "liquid"
+        else:
+            # Unknown type - check macro for hints, defaulting to solid
+            macro = self.ship_class.lower()
+            self.mining_cargo_type = "liquid" if "liquid" in macro or "gas" in macro else "solid"
 
 
 @dataclass
@@ -133,9 +162,14 @@ class Station:
         """Total cargo capacity of all assigned ships."""
         return sum(s.cargo_capacity for s in self.assigned_ships)
 
-    @property
+    @cached_property
+    def module_count(self) -> int:
+        """Number of production modules on this station (computed once)."""
+        return sum(1 for m in self.modules if m.is_production)
+
+    @cached_property
     def unique_products(self) -> set:
-        """Get unique products produced by this station."""
+        """Get unique products produced by this station (computed once)."""
         products = set()
         for module in self.production_modules:
             if module.output_ware:
@@ -154,7 +188,7 @@ class EmpireData:
     @property
     def total_production_modules(self) -> int:
         """Total number of production modules across all stations."""
-        return sum(len(s.production_modules) for s in self.stations)
+        return sum(s.module_count for s in self.stations)
 
     @property
     def all_assigned_ships(self) -> List[Ship]:
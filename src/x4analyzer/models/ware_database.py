@@ -1,5 +1,7 @@
 """Database of X4 wares and their categories based on production tiers."""
 
+from functools import lru_cache
+
 from .entities import Ware, WareCategory
 
 # Comprehensive ware database with tier-based categorization
@@ -85,8 +87,14 @@ def normalize_ware_id(ware_id: str) -> str:
     return ware_id.lower().replace("_", "").replace(" ", "")
 
 
+@lru_cache(maxsize=None)
 def get_ware(ware_id: str) -> Ware:
-    """Get ware from database or create a new unknown ware."""
+    """
+    Get ware from database or create a new unknown ware.
+
+    Results are cached: the database is static and a save only references a
+    bounded set of ware IDs, so each ID is normalized once per process.
+    """
     normalized = normalize_ware_id(ware_id)
 
     if normalized in WARE_DATABASE:
@@ -10,6 +10,12 @@ from dataclasses import dataclass, field
 from ..models.entities import Station, ProductionModule, Ship, ShipPurpose, TradeResource, EmpireData
 from ..models.ware_database import get_ware
 
+try:
+    # ISA-L's igzip is a drop-in replacement for gzip that inflates several times faster
+    from isal import igzip as gzip_impl
+except ImportError:
+    gzip_impl = gzip
+
 
 def safe_int(value: Union[str, None], default: int = 0) -> int:
     """Safely convert a value to int, returning default on failure."""
@@ -44,6 +50,12 @@ def setup_logger():
 
 logger, LOG_FILE = setup_logger()
 
+# Component classes X4 uses for ships
+SHIP_CLASSES = frozenset(('ship_xs', 'ship_s', 'ship_m', 'ship_l', 'ship_xl'))
+
+# Macro prefixes of production modules, e.g. prod_gen_energycells_macro
+PRODUCTION_MODULE_PREFIXES = ('prod_gen_', 'prod_arg_', 'prod_par_', 'prod_tel_', 'prod_spl_', 'prod_ter_')
+
 
 @dataclass
 class ParsedStation:
@@ -126,13 +138,13 @@ class StreamingParser:
         # Open file (handle gzip or plain XML)
         file_handle: BinaryIO
         try:
-            gzip_handle = gzip.open(self.file_path, 'rb')
+            gzip_handle = gzip_impl.open(self.file_path, 'rb')
             # Test if it's actually gzipped
             gzip_handle.read(1)
             gzip_handle.seek(0)
             file_handle = gzip_handle  # type: ignore[assignment]
             logger.info("File is gzipped")
-        except gzip.BadGzipFile:
+        except gzip_impl.BadGzipFile:
             file_handle = open(self.file_path, 'rb')
             logger.info("File is plain XML")
 
@@ -170,41 +182,47 @@ class StreamingParser:
         if progress_callback:
             progress_callback("Scanning save file...", 0)
 
-        for event, elem in iterparse(file_handle, events=('start', 'end')):
+        # Bind hot lookups once; this loop runs for every element in the save
+        stations = self._stations
+        ships = self._ships
+        ship_commander_connected = self._ship_commander_connected
+        commander_log_count = 0
+
+        # huge_tree lifts libxml2's depth and text-node limits, which large
+        # late-game saves can exceed
+        for event, elem in iterparse(file_handle, events=('start', 'end'), huge_tree=True):
             tag = elem.tag
 
             if event == 'start':
                 path.append(tag)
 
-                # Track when we enter a commander connection (inside a ship)
-                if tag == 'connection' and elem.get('connection') == 'commander':
-                    in_commander_connection = True
+                if tag == 'connection':
+                    conn_type = elem.get('connection')
 
-                # Track when we enter a subordinates connection (inside a station or ship)
-                if tag == 'connection' and elem.get('connection') == 'subordinates':
-                    current_subordinates_conn_id = elem.get('id', '')
-                    # Record this subordinates connection ID for the current station
-                    if self._in_player_station and self._current_station_id and current_subordinates_conn_id:
-                        station = self._stations.get(self._current_station_id)
-                        if station:
-                            station.subordinate_connection_ids.append(current_subordinates_conn_id)
-                            self._subordinate_conn_to_station[current_subordinates_conn_id] = self._current_station_id
-                    # Also record for player ships (fleet commanders)
-                    elif current_player_ship_id and current_subordinates_conn_id:
-                        self._subordinate_conn_to_ship[current_subordinates_conn_id] = current_player_ship_id
+                    # Track when we enter a commander connection (inside a ship)
+                    if conn_type == 'commander':
+                        in_commander_connection = True
+
+                    # Track when we enter a subordinates connection (inside a station or ship)
+                    elif conn_type == 'subordinates':
+                        current_subordinates_conn_id = elem.get('id', '')
+                        # Record this subordinates connection ID for the current station
+                        if self._in_player_station and self._current_station_id and current_subordinates_conn_id:
+                            station = stations.get(self._current_station_id)
+                            if station:
+                                station.subordinate_connection_ids.append(current_subordinates_conn_id)
+                                self._subordinate_conn_to_station[current_subordinates_conn_id] = self._current_station_id
+                        # Also record for player ships (fleet commanders)
+                        elif current_player_ship_id and current_subordinates_conn_id:
+                            self._subordinate_conn_to_ship[current_subordinates_conn_id] = current_player_ship_id
 
                 # Track nested components
-                if tag == 'component':
+                elif tag == 'component':
                     comp_class = elem.get('class', '')
                     comp_owner = elem.get('owner', '')
                     comp_id = elem.get('code', elem.get('id', ''))
 
-                    component_stack.append({
-                        'class': comp_class,
-                        'owner': comp_owner,
-                        'id': comp_id,
-                        'elem': elem
-                    })
+                    component_stack.append((comp_class, comp_owner, comp_id))
 
                     # Found a player station
                     if comp_class == 'station' and comp_owner == 'player':
@@ -215,7 +233,7 @@ class StreamingParser:
                             name=elem.get('name', f'Station {comp_id}'),
                             owner=comp_owner
                         )
-                        self._stations[comp_id] = station
+                        stations[comp_id] = station
                         station_count += 1
 
                         if progress_callback and station_count % 5 == 0:
@@ -223,74 +241,64 @@ class StreamingParser:
 
                     # Found a ship - X4 uses class="ship_xs", "ship_s", "ship_m", "ship_l", "ship_xl"
                     # Exclude dockingbay, dockarea, and other station modules
-                    valid_ship_classes = ('ship_xs', 'ship_s', 'ship_m', 'ship_l', 'ship_xl')
-                    is_ship = comp_class in valid_ship_classes
-
-                    # Filter out laser towers and other deployables (they're not real ships)
-                    ship_macro = elem.get('macro', '').lower()
-                    is_deployable = 'lasertower' in ship_macro or 'satellite' in ship_macro or 'deployable' in ship_macro
-
-                    if is_ship and not is_deployable:
-                        ship = ParsedShip(
-                            ship_id=comp_id,
-                            name=elem.get('name', f'Ship {comp_id}'),
-                            macro=elem.get('macro', ''),
-                            owner=comp_owner,
-                            purpose=elem.get('purpose', '')
-                        )
-                        self._ships[comp_id] = ship
-                        ship_count += 1
-
-                        # Track this ship if it's a player ship (for commander linking)
-                        if comp_owner == 'player':
-                            current_player_ship_id = comp_id
-                            player_ship_count += 1
-
-                        if ship_count <= 10 or ship_count % 100 == 0:
-                            logger.debug(f"Found ship: {ship.name} ({comp_id}) class={comp_class} owner={comp_owner}")
-
-                        if progress_callback and ship_count % 500 == 0:
-                            progress_callback(f"Found {station_count} stations, {ship_count} ships...", station_count)
-
-            elif event == 'end':
+                    elif comp_class in SHIP_CLASSES:
+                        macro = elem.get('macro', '')
+
+                        # Filter out laser towers and other deployables (they're not real ships)
+                        ship_macro = macro.lower()
+                        if not ('lasertower' in ship_macro or 'satellite' in ship_macro or 'deployable' in ship_macro):
+                            ship = ParsedShip(
+                                ship_id=comp_id,
+                                name=elem.get('name', f'Ship {comp_id}'),
+                                macro=macro,
+                                owner=comp_owner,
+                                purpose=elem.get('purpose', '')
+                            )
+                            ships[comp_id] = ship
+                            ship_count += 1
+
+                            # Track this ship if it's a player ship (for commander linking)
+                            if comp_owner == 'player':
+                                current_player_ship_id = comp_id
+                                player_ship_count += 1
+
+                            if ship_count <= 10 or ship_count % 100 == 0:
+                                logger.debug(f"Found ship: {ship.name} ({comp_id}) class={comp_class} owner={comp_owner}")
+
+                            if progress_callback and ship_count % 500 == 0:
+                                progress_callback(f"Found {station_count} stations, {ship_count} ships...", station_count)
+
+            else:
                 # Process completed elements
 
                 # Capture the <connected> element inside commander connection
-                if tag == 'connected' and in_commander_connection and current_player_ship_id:
-                    connected_id = elem.get('connection', '')
-                    if connected_id:
-                        # Store this for post-processing: connected_id -> ship_id
-                        self._ship_commander_connected[current_player_ship_id] = connected_id
-                        ship = self._ships.get(current_player_ship_id)
-                        if ship:
-                            ship.commander_id = connected_id
-                            logger.debug(f"Ship {current_player_ship_id} commander connected to {connected_id}")
+                if tag == 'connected':
+                    if in_commander_connection and current_player_ship_id:
+                        connected_id = elem.get('connection', '')
+                        if connected_id:
+                            # Store this for post-processing: connected_id -> ship_id
+                            ship_commander_connected[current_player_ship_id] = connected_id
+                            ship = ships.get(current_player_ship_id)
+                            if ship:
+                                ship.commander_id = connected_id
+                                commander_log_count += 1
+                                if commander_log_count <= 20:
+                                    logger.debug(f"Ship {current_player_ship_id} commander connected to {connected_id}")
 
                 # Parse ship orders to determine what they're mining/trading
-                if tag == 'order' and current_player_ship_id:
-                    order_type = elem.get('order', '')
-                    is_default = elem.get('default') == '1'
-                    ship = self._ships.get(current_player_ship_id)
-                    if ship and is_default and order_type:
-                        ship.order_type = order_type
-                        # For mining orders, we'll capture the warebasket from param elements
-                        if order_type == 'MiningRoutine':
-                            # The warebasket param will be captured below
-                            pass
+                elif tag == 'order':
+                    if current_player_ship_id:
+                        order_type = elem.get('order', '')
+                        ship = ships.get(current_player_ship_id)
+                        if ship and order_type and elem.get('default') == '1':
+                            ship.order_type = order_type
 
                 # Parse order parameters (specifically warebasket for mining)
-                if tag == 'param' and current_player_ship_id:
-                    param_name = elem.get('name', '')
-                    if param_name == 'warebasket':
-                        # warebasket contains ware IDs for what the ship is mining
-                        # It can be a list value like "15071" which maps to wares
-                        ship = self._ships.get(current_player_ship_id)
-                        if ship and ship.order_type == 'MiningRoutine':
-                            # The value is an internal ID, but we can also check warebasket_override
-                            pass
-                    elif param_name == 'warebasket_override':
-                        # This is more reliable - contains actual ware override
-                        ship = self._ships.get(current_player_ship_id)
+                elif tag == 'param':
+                    # warebasket holds internal IDs; warebasket_override is more
+                    # reliable and contains the actual ware override
+                    if current_player_ship_id and elem.get('name') == 'warebasket_override':
+                        ship = ships.get(current_player_ship_id)
                         if ship and ship.order_type == 'MiningRoutine':
                             # Value is internal ID, we'll resolve in post-processing
                             value = elem.get('value', '')
@@ -298,7 +306,7 @@ class StreamingParser:
                                 ship.mining_ware = value  # Store for now, resolve later
 
                 # Track when we exit connection elements
-                if tag == 'connection':
+                elif tag == 'connection':
                     conn_type = elem.get('connection', '')
                     if conn_type == 'commander':
                         in_commander_connection = False
@@ -306,9 +314,9 @@ class StreamingParser:
                         current_subordinates_conn_id = None
 
                 # Save metadata from info element
-                if tag == 'save' and 'info' in path:
+                elif tag == 'save':
                     date = elem.get('date', '')
-                    if date:
+                    if date and 'info' in path:
                         try:
                             from datetime import datetime
                             ts = int(date)
@@ -316,98 +324,97 @@ class StreamingParser:
                         except (ValueError, OSError):
                             pass
 
-                elif tag == 'player' and 'info' in path:
-                    self._player_name = elem.get('name', 'Unknown')
+                elif tag == 'player':
+                    if 'info' in path:
+                        self._player_name = elem.get('name', 'Unknown')
 
                 # Process station subordinates (ship assignments)
-                elif tag == 'component' and len(component_stack) > 0:
-                    comp_info = component_stack[-1]
-
-                    # Check if this is a subordinate reference within a player station
-                    if self._in_player_station and 'subordinates' in path:
-                        sub_id = elem.get('code', elem.get('id', ''))
-                        if sub_id and self._current_station_id:
-                            station = self._stations.get(self._current_station_id)
-                            if station and sub_id not in station.subordinate_ids:
-                                station.subordinate_ids.append(sub_id)
-
-                    component_stack.pop()
+                elif tag == 'component':
+                    if component_stack:
+                        comp_class, comp_owner, _ = component_stack.pop()
+
+                        # Check if this is a subordinate reference within a player station
+                        if self._in_player_station and 'subordinates' in path:
+                            sub_id = elem.get('code', elem.get('id', ''))
+                            if sub_id and self._current_station_id:
+                                station = stations.get(self._current_station_id)
+                                if station and sub_id not in station.subordinate_ids:
+                                    station.subordinate_ids.append(sub_id)
 
-                    # Check if we're leaving the player station
-                    if comp_info['class'] == 'station' and comp_info['owner'] == 'player':
-                        self._in_player_station = False
-                        self._current_station_id = None
+                        if comp_owner == 'player':
+                            # Check if we're leaving the player station
+                            if comp_class == 'station':
+                                self._in_player_station = False
+                                self._current_station_id = None
 
-                    # Check if we're leaving a player ship
-                    if comp_info['class'].startswith('ship_') and comp_info['owner'] == 'player':
-                        current_player_ship_id = None
+                            # Check if we're leaving a player ship
+                            elif comp_class.startswith('ship_'):
+                                current_player_ship_id = None
 
                 # Process production module entries
-                elif tag == 'entry' and self._in_player_station:
-                    macro = elem.get('macro', '')
-                    macro_lower = macro.lower()
-                    station = self._stations.get(self._current_station_id)
-
-                    if station:
-                        # Track production modules - must start with a production module prefix
-                        # X4 production module macros follow pattern: prod_gen_*, prod_arg_*, prod_par_*, etc.
-                        is_production_module = any(
-                            macro_lower.startswith(prefix) for prefix in
-                            ['prod_gen_', 'prod_arg_', 'prod_par_', 'prod_tel_', 'prod_spl_', 'prod_ter_']
-                        )
-                        if is_production_module:
-                            station.modules.append(macro)
-
-                        # Detect station type from buildmodule macros
-                        # Priority: shipyard > wharf > equipmentdock
-                        # buildmodule_*_ships_l_* or ships_xl_* = Shipyard (builds L/XL ships)
-                        # buildmodule_*_ships_m_* = Wharf (builds M class ships)
-                        # buildmodule_*_equip_* = Equipment dock
-                        if 'buildmodule' in macro_lower:
-                            if '_ships_l_' in macro_lower or '_ships_xl_' in macro_lower:
-                                # Shipyard - highest priority, always set
-                                station.station_type = 'shipyard'
-                            elif '_ships_m_' in macro_lower:
-                                # Wharf - set only if not already shipyard
-                                if station.station_type != 'shipyard':
-                                    station.station_type = 'wharf'
-                            elif '_equip_' in macro_lower:
-                                # Equipment dock - set only if not already wharf or shipyard
-                                if station.station_type not in ('wharf', 'shipyard'):
-                                    station.station_type = 'equipmentdock'
-
-                        # Track if station has defence modules (for later classification)
-                        elif 'defence_' in macro_lower:
-                            station.has_defence = True
-
-                # Process trade data
-                elif tag == 'trade' and self._in_player_station:
-                    ware_id = elem.get('ware', '')
-                    if ware_id:
-                        station = self._stations.get(self._current_station_id)
+                elif tag == 'entry':
+                    if self._in_player_station:
+                        station = stations.get(self._current_station_id)
                         if station:
-                            is_seller = elem.get('seller') is not None
-                            is_buyer = elem.get('buyer') is not None
-                            amount = safe_int(elem.get('amount'), default=0)
-                            desired = safe_int(elem.get('desired'), default=0)
-
-                            if ware_id not in station.trade_wares:
-                                station.trade_wares[ware_id] = {'sell': [], 'buy': []}
+                            macro = elem.get('macro', '')
+                            macro_lower = macro.lower()
+
+                            # Track production modules - must start with a production module prefix
+                            # X4 production module macros follow pattern: prod_gen_*, prod_arg_*, prod_par_*, etc.
+                            if macro_lower.startswith(PRODUCTION_MODULE_PREFIXES):
+                                station.modules.append(macro)
+
+                            # Detect station type from buildmodule macros
+                            # Priority: shipyard > wharf > equipmentdock
+                            # buildmodule_*_ships_l_* or ships_xl_* = Shipyard (builds L/XL ships)
+                            # buildmodule_*_ships_m_* = Wharf (builds M class ships)
+                            # buildmodule_*_equip_* = Equipment dock
+                            if 'buildmodule' in macro_lower:
+                                if '_ships_l_' in macro_lower or '_ships_xl_' in macro_lower:
+                                    # Shipyard - highest priority, always set
+                                    station.station_type = 'shipyard'
+                                elif '_ships_m_' in macro_lower:
+                                    # Wharf - set only if not already shipyard
+                                    if station.station_type != 'shipyard':
+                                        station.station_type = 'wharf'
+                                elif '_equip_' in macro_lower:
+                                    # Equipment dock - set only if not already wharf or shipyard
+                                    if station.station_type not in ('wharf', 'shipyard'):
+                                        station.station_type = 'equipmentdock'
+
+                            # Track if station has defence modules (for later classification)
+                            elif 'defence_' in macro_lower:
+                                station.has_defence = True
 
-                            trade_entry = {'amount': amount, 'desired': desired}
-                            if is_seller:
-                                station.trade_wares[ware_id]['sell'].append(trade_entry)
-                            elif is_buyer:
-                                station.trade_wares[ware_id]['buy'].append(trade_entry)
+                # Process trade data
+                elif tag == 'trade':
+                    if self._in_player_station:
+                        ware_id = elem.get('ware', '')
+                        if ware_id:
+                            station = stations.get(self._current_station_id)
+                            if station:
+                                trade = station.trade_wares.get(ware_id)
+                                if trade is None:
+                                    trade = station.trade_wares[ware_id] = {'sell': [], 'buy': []}
+
+                                trade_entry = {
+                                    'amount': safe_int(elem.get('amount'), default=0),
+                                    'desired': safe_int(elem.get('desired'), default=0)
+                                }
+                                if elem.get('seller') is not None:
+                                    trade['sell'].append(trade_entry)
+                                elif elem.get('buyer') is not None:
+                                    trade['buy'].append(trade_entry)
 
                 # Process ship cargo capacity
-                elif tag == 'cargo' and len(component_stack) > 0:
-                    comp_info = component_stack[-1]
-                    # X4 uses class="ship_s", "ship_m", "ship_l", "ship_xl"
-                    if comp_info['class'].startswith('ship_') or comp_info['class'] == 'ship':
-                        ship = self._ships.get(comp_info['id'])
-                        if ship:
-                            ship.cargo_capacity = safe_int(elem.get('max'), default=0)
+                elif tag == 'cargo':
+                    if component_stack:
+                        comp_class, _, comp_id = component_stack[-1]
+                        # X4 uses class="ship_s", "ship_m", "ship_l", "ship_xl"
+                        if comp_class.startswith('ship_') or comp_class == 'ship':
+                            ship = ships.get(comp_id)
+                            if ship:
+                                ship.cargo_capacity = safe_int(elem.get('max'), default=0)
 
                 # Clear element and remove from parent to free memory
                 elem.clear()
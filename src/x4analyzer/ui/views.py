@@ -183,7 +183,7 @@ class ViewRenderer:
                     current_sector = station.sector
 
                 products = len(station.unique_products)
-                modules = len(station.production_modules)
+                modules = station.module_count
                 self.console.print(
                     f"  [{i}] {station.name} - "
                     f"[green]{modules} modules[/green], "
@@ -217,7 +217,7 @@ class ViewRenderer:
         self.console.print(f"[bold cyan]{station.name}[/bold cyan]")
         self.console.print(f"Sector: {station.sector}")
         self.console.print(f"Type: {station.station_type.title()}")
-        self.console.print(f"Total Modules: {len(station.production_modules)}\n")
+        self.console.print(f"Total Modules: {station.module_count}\n")
 
         # Check if we have rate data
         has_rates = self.analyzer.has_rate_data
@@ -307,15 +307,15 @@ class ViewRenderer:
 
             if net_rates:
                 # Show wares that are net negative (station consumes more than produces)
-                deficits = [n for n in net_rates if n["net_rate"] < 0]
-                surpluses = [n for n in net_rates if n["net_rate"] > 0]
+                deficits = [n for n in net_rates if n.net_rate < 0]
+                surpluses = [n for n in net_rates if n.net_rate > 0]
 
                 if deficits:
                     self.console.print("[bold yellow]Net Deficits (needs import):[/bold yellow]")
                     for item in deficits[:5]:  # Top 5
                         self.console.print(
-                            f"  {item['ware']}: [red]{item['net_rate']:+,.0f}/hr[/red] "
-                            f"(consumes {item['consumption']:,.0f}, produces {item['production']:,.0f})"
+                            f"  {item.ware}: [red]{item.net_rate:+,.0f}/hr[/red] "
+                            f"(consumes {item.consumption:,.0f}, produces {item.production:,.0f})"
                         )
                     if len(deficits) > 5:
                         self.console.print(f"  [dim]...and {len(deficits) - 5} more[/dim]")
@@ -325,7 +325,7 @@ class ViewRenderer:
                     self.console.print("[bold green]Net Surplus (for export/storage):[/bold green]")
                     for item in surpluses[:5]:  # Top 5
                         self.console.print(
-                            f"  {item['ware']}: [green]{item['net_rate']:+,.0f}/hr[/green]"
+                            f"  {item.ware}: [green]{item.net_rate:+,.0f}/hr[/green]"
                         )
                     if len(surpluses) > 5:
                         self.console.print(f"  [dim]...and {len(surpluses) - 5} more[/dim]")
@@ -1276,7 +1276,7 @@ class ViewRenderer:
                     "name": station.name,
                     "sector": station.sector,
                     "station_type": station.station_type,
-                    "production_modules": len(station.production_modules),
+                    "production_modules": station.module_count,
                     "products": [w.name for w in station.unique_products],
                     "assigned_ships": len(station.assigned_ships),
                     "traders": len(station.traders),
@@ -1375,7 +1375,7 @@ class ViewRenderer:
                     f.write(f"{station.name}\n")
                     f.write(f"  Type: {station.station_type}\n")
                     f.write(f"  Sector: {station.sector}\n")
-                    f.write(f"  Production Modules: {len(station.production_modules)}\n")
+                    f.write(f"  Production Modules: {station.module_count}\n")
                     f.write(f"  Assigned Ships: {len(station.assigned_ships)} "
                            f"({len(station.traders)} traders, {len(station.miners)} miners)\n")
 
@@ -1560,7 +1560,7 @@ class ViewRenderer:
                 self.console.print(f"  Module change: [{delta_color}]{delta_sign}{comparison.total_modules_delta}[/{delta_color}]")
 
         # Degraded wares (most important)
-        degraded = [c for c in comparison.ware_changes if c.change_type == ChangeType.DEGRADED]
+        degraded = [c for c in comparison.ware_changes if c.change_type is ChangeType.DEGRADED]
         if degraded:
             self.console.print("\n[bold red]DEGRADED (requires attention)[/bold red]")
             self.console.print("─" * 60)
@@ -1589,7 +1589,7 @@ class ViewRenderer:
             self.console.print(table)
 
         # Improved wares
-        improved = [c for c in comparison.ware_changes if c.change_type == ChangeType.IMPROVED]
+        improved = [c for c in comparison.ware_changes if c.change_type is ChangeType.IMPROVED]
         if improved:
             self.console.print("\n[bold green]IMPROVED[/bold green]")
             self.console.print("─" * 60)
@@ -1617,7 +1617,7 @@ class ViewRenderer:
             self.console.print(table)
 
         # New production
-        new_prod = [c for c in comparison.ware_changes if c.change_type == ChangeType.NEW_PRODUCTION]
+        new_prod = [c for c in comparison.ware_changes if c.change_type is ChangeType.NEW_PRODUCTION]
         if new_prod:
             self.console.print("\n[bold cyan]NEW PRODUCTION[/bold cyan]")
             self.console.print("─" * 60)
@@ -1628,7 +1628,7 @@ class ViewRenderer:
                 )
 
         # Stopped production
-        stopped = [c for c in comparison.ware_changes if c.change_type == ChangeType.STOPPED]
+        stopped = [c for c in comparison.ware_changes if c.change_type is ChangeType.STOPPED]
         if stopped:
             self.console.print("\n[bold yellow]STOPPED PRODUCTION[/bold yellow]")
             self.console.print("─" * 60)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Tests for the production analyzer using an in-memory empire."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from x4analyzer.models.entities import EmpireData, Station, ProductionModule, TradeResource
+from x4analyzer.models.ware_database import get_ware
+from x4analyzer.analyzers.production_analyzer import ProductionAnalyzer
+from x4analyzer.analyzers.expansion_planner import (
+    calculate_batch_feasibility, calculate_expansion_feasibility, calculate_expansion_impact
+)
+from x4analyzer.game_data.wares_extractor import ProductionData, ProductionMethod, ResourceRequirement
+
+
+def make_module(station_id: str, ware_id: str, amount: int = 0, capacity: int = 0) -> ProductionModule:
+    """Create a production module for a ware."""
+    ware = get_ware(ware_id)
+    return ProductionModule(
+        module_id=f"{station_id}_{ware_id}",
+        macro=f"prod_gen_{ware_id}_macro",
+        output_ware=ware,
+        output=TradeResource(ware=ware, amount=amount, capacity=capacity)
+    )
+
+
+def make_empire() -> EmpireData:
+    """Build a small empire with two production stations."""
+    hull_station = Station(station_id="st_1", name="Hull Works", owner="player")
+    hull_station.modules = [
+        make_module("st_1", "hullparts", 500, 2000),
+        make_module("st_1", "hullparts", 100, 2000),
+        make_module("st_1", "energycells", 900, 1000),
+    ]
+    hull_station.input_demands = {"graphene": 400, "refinedmetals": 800}
+
+    metal_station = Station(station_id="st_2", name="Metal Forge", owner="player")
+    metal_station.modules = [make_module("st_2", "refinedmetals", 50, 5000)]
+    metal_station.input_demands = {"ore": 3000, "energycells": 200}
+
+    return EmpireData(stations=[hull_station, metal_station])
+
+
+class FakeWaresExtractor:
+    """Stand-in for WaresExtractor with a fixed set of recipes."""
+
+    def __init__(self):
+        self.wares = {
+            "hullparts": self._ware("hullparts", 600, 100, [("graphene", 20), ("refinedmetals", 80)]),
+            "energycells": self._ware("energycells", 360, 150, []),
+            "refinedmetals": self._ware("refinedmetals", 300, 90, [("energycells", 40), ("ore", 200)]),
+        }
+
+    @staticmethod
+    def _ware(ware_id, time_seconds, amount, resources):
+        method = ProductionMethod(
+            method_id="default",
+            time_seconds=time_seconds,
+            amount_produced=amount,
+            resources=[ResourceRequirement(ware_id=w, amount=a) for w, a in resources]
+        )
+        return ProductionData(ware_id=ware_id, name=ware_id, production_methods=[method])
+
+    def extract(self):
+        return self.wares
+
+
+def test_get_ware_stats():
+    """Ware stats can be looked up by ID or display name."""
+    analyzer = ProductionAnalyzer(make_empire())
+
+    stats = analyzer.get_ware_stats("hullparts")
+    assert stats is not None
+    assert stats.module_count == 2
+
+    assert analyzer.get_ware_stats("Hull Parts") is stats
+    assert analyzer.get_ware_stats("HullParts") is stats
+    assert analyzer.get_ware_stats("refined metals") is analyzer.get_ware_stats("refinedmetals")
+
+    # Consumed-only wares are indexed too
+    ore_stats = analyzer.get_ware_stats("ore")
+    assert ore_stats is not None
+    assert ore_stats.module_count == 0
+    assert ore_stats.total_consumption_demand == 3000
+
+    assert analyzer.get_ware_stats("nonexistent") is None
+
+
+def test_search_production():
+    """Search matches ware names and IDs case-insensitively."""
+    analyzer = ProductionAnalyzer(make_empire())
+
+    assert [s.ware.ware_id for s in analyzer.search_production("HULL")] == ["hullparts"]
+    assert {s.ware.ware_id for s in analyzer.search_production("cells")} == {"energycells"}
+    assert analyzer.search_production("zzz") == []
+
+
+def test_net_available():
+    """Net available rate follows loaded game data."""
+    analyzer = ProductionAnalyzer(make_empire())
+    assert analyzer.net_available("hullparts") == 0.0
+    assert analyzer.net_available("nonexistent") is None
+
+    assert analyzer.load_game_data(FakeWaresExtractor())
+    stats = analyzer.get_ware_stats("refinedmetals")
+    expected = stats.production_rate_per_hour - stats.consumption_rate_per_hour
+    assert stats.has_rate_data
+    assert analyzer.net_available("refinedmetals") == expected
+    assert analyzer.net_available("Refined Metals") == expected
+
+
+def test_analyze_dependencies():
+    """Dependencies come from what producing/consuming stations use."""
+    analyzer = ProductionAnalyzer(make_empire())
+
+    # Without rate data there is nothing to link
+    assert analyzer.analyze_dependencies("hullparts") == {"inputs": [], "consumers": []}
+
+    assert analyzer.load_game_data(FakeWaresExtractor())
+
+    deps = analyzer.analyze_dependencies("refinedmetals")
+    assert {s.ware.ware_id for s in deps["inputs"]} == {"energycells", "ore"}
+    assert {s.ware.ware_id for s in deps["consumers"]} == {"hullparts", "energycells"}
+
+    deps = analyzer.analyze_dependencies("hullparts")
+    assert {s.ware.ware_id for s in deps["inputs"]} == {"graphene", "refinedmetals"}
+    assert deps["consumers"] == []
+
+
+def test_station_summary():
+    """Station summary reports per-ware rates and net balance."""
+    analyzer = ProductionAnalyzer(make_empire())
+    assert analyzer.load_game_data(FakeWaresExtractor())
+    station = analyzer.empire.stations[0]
+
+    summary = analyzer.get_station_summary(station)
+    produced = {r.ware_id: r for r in summary["produced_wares"]}
+    assert set(produced) == {"hullparts", "energycells"}
+    assert produced["hullparts"].modules == 2
+    assert produced["hullparts"].rate == analyzer.get_ware_stats("hullparts").get_station_production_rate(station.name)
+
+    consumed = {r.ware_id: r.rate for r in summary["consumed_wares"]}
+    assert set(consumed) == {"graphene", "refinedmetals"}
+
+    net = {r.ware: r for r in summary["net_rates"]}
+    assert net["Graphene"].production == 0
+    assert net["Graphene"].net_rate == -consumed["graphene"]
+    assert [r.net_rate for r in summary["net_rates"]] == sorted(r.net_rate for r in summary["net_rates"])
+
+
+def test_expansion_feasibility_matches_plan():
+    """The feasibility fast path agrees with the full expansion plan."""
+    analyzer = ProductionAnalyzer(make_empire())
+    extractor = FakeWaresExtractor()
+    assert analyzer.load_game_data(extractor)
+
+    for ware_id in ("hullparts", "refinedmetals"):
+        for modules in (1, 10):
+            plan = calculate_expansion_impact(ware_id, modules, extractor, analyzer)
+            feasible, deficit = calculate_expansion_feasibility(ware_id, modules, extractor, analyzer)
+            expected = sum(-r.surplus_or_deficit for r in plan.input_requirements if r.status == "insufficient")
+            assert feasible == plan.is_feasible
+            assert abs(deficit - expected) < 1e-6
+
+    batch = calculate_batch_feasibility({"hullparts": 10, "graphene": 1}, extractor, analyzer)
+    assert list(batch) == ["hullparts"]
+    assert batch["hullparts"] == calculate_expansion_feasibility("hullparts", 10, extractor, analyzer)
+
+
+if __name__ == "__main__":
+    test_get_ware_stats()
+    test_search_production()
+    test_net_available()
+    test_analyze_dependencies()
+    test_station_summary()
+    test_expansion_feasibility_matches_plan()
+    print("✓ All analyzer tests passed")
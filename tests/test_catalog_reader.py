@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Tests for reading files from X4 catalog/data pairs."""
+
+import gzip
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from x4analyzer.game_data.catalog_reader import CatalogReader
+
+
+def write_catalog(cat_path: Path, files):
+    """Write a .cat/.dat pair holding (filename, data) in order."""
+    lines = []
+    data = b""
+    for filename, content in files:
+        lines.append(f"{filename} {len(content)} 1700000000 0123456789abcdef")
+        data += content
+    cat_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    cat_path.with_suffix(".dat").write_bytes(data)
+
+
+def make_game_dir(root: Path) -> Path:
+    """Build a game directory with a base catalog, an override and an extension diff."""
+    wares = b"<wares><ware id=\"energycells\"/></wares>"
+    write_catalog(root / "01.cat", [
+        ("libraries/wares.xml", wares),
+        ("t/0001-l044.xml", gzip.compress(b"<language/>")),
+        ("Assets\\Units\\My Ship.xml", b"<ship/>"),
+    ])
+    write_catalog(root / "02.cat", [("t/0001-l044.xml", b"<language id=\"44\"/>")])
+    (root / "03.cat").write_bytes(b"")
+    (root / "03.dat").write_bytes(b"")
+
+    ext_dir = root / "extensions" / "ego_dlc_test"
+    ext_dir.mkdir(parents=True)
+    # Compressed, and larger than the base file, so it is looked at first
+    diff = gzip.compress(b"<diff>" + b"<add sel=\"/wares\"/>" * 500 + b"</diff>")
+    write_catalog(ext_dir / "ext_01.cat", [("libraries/wares.xml", diff)])
+    return root
+
+
+def test_read_files():
+    """Files are found case- and separator-insensitively, later catalogs win."""
+    with tempfile.TemporaryDirectory() as tmp:
+        reader = CatalogReader(make_game_dir(Path(tmp)))
+
+        assert reader.file_exists("libraries/wares.xml")
+        assert reader.file_exists("LIBRARIES\\WARES.XML")
+        assert reader.file_exists("assets/units/my ship.xml")
+        assert not reader.file_exists("libraries/missing.xml")
+
+        assert reader.read_file("t/0001-l044.xml") == b"<language id=\"44\"/>"
+        assert reader.read_file("assets/units/MY SHIP.xml") == b"<ship/>"
+        assert reader.read_file("libraries/wares.xml").startswith(b"<diff><add ")
+        assert reader.read_file("libraries/missing.xml") is None
+
+        # Closing unmaps the .dat files; later reads map them again
+        reader.close()
+        assert reader.read_file("assets/units/my ship.xml") == b"<ship/>"
+        reader.close()
+
+
+def test_read_base_file():
+    """Base file lookup skips extension diffs and decompresses gzip data."""
+    with tempfile.TemporaryDirectory() as tmp, CatalogReader(make_game_dir(Path(tmp))) as reader:
+        assert reader.read_base_text_file("libraries/wares.xml") == "<wares><ware id=\"energycells\"/></wares>"
+        # Both versions are full files; the larger (gzipped) one is tried first
+        assert reader.read_base_file("t/0001-l044.xml") == b"<language/>"
+        # Decompressed data is cached until clear_cache()
+        assert reader.read_base_file("t/0001-l044.xml") is reader.read_base_file("t/0001-l044.xml")
+        assert reader.read_base_file("libraries/missing.xml") is None
+        assert len(reader.all_entries["libraries/wares.xml"]) == 2
+
+
+if __name__ == "__main__":
+    test_read_files()
+    test_read_base_file()
+    print("✓ All catalog reader tests passed")